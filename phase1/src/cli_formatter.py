@@ -3,13 +3,14 @@ CLI display formatting utilities.
 
 Functions for formatting task lists, details, messages, and help text.
 """
+import sys
+from typing import Collection, Optional
+
 from src.models import Task
-from datetime import datetime
 
 
-def format_welcome() -> str:
-    """Return welcome banner for application startup."""
-    return """
+# Static banners and help text
+WELCOME_BANNER = """
 ╔════════════════════════════════════════════════╗
 ║      Todo App - Phase I (Console)             ║
 ║      Evolution of Todo Project                ║
@@ -18,10 +19,114 @@ def format_welcome() -> str:
 Type 'help' for available commands.
 """
 
+GOODBYE_MSG = "Goodbye! Your tasks are not saved (in-memory only)."
+
+HELP_TEXT = """
+Todo App - Available Commands
+═══════════════════════════════════════════════════════════════
+
+Task Management:
+  add <title> [description]
+      Create a new task with optional description
+      Example: add "Buy groceries" "Milk, eggs, bread"
+
+  list
+      Display all tasks in a formatted table
+      Example: list
+
+  view <id>
+      Show detailed information for a specific task
+      Example: view 1
+
+  update <id> [--title <title>] [--description <desc>]
+      Update task title and/or description
+      Example: update 1 --title "New title"
+      Example: update 1 --description "New description"
+      Example: update 1 --title "Title" --description "Desc"
+
+  delete <id>
+      Permanently delete a task
+      Example: delete 1
+
+  complete <id>
+      Mark a task as completed
+      Example: complete 1
+
+  uncomplete <id>
+      Mark a task as incomplete
+      Example: uncomplete 1
+
+General:
+  help
+      Show this help message
+
+  exit
+      Exit the application (all data will be lost)
+
+═══════════════════════════════════════════════════════════════
+"""
+
+# Glyph markers
+CHECK_MARK = "✓"
+_SUCCESS_PREFIX = "✓ "
+_ERROR_PREFIX = "✗ Error: "
+_DETAIL_RULE = "────────────────────────────────────────"
+
+# Status cells, pre-padded to the 6-character column width
+_STATUS_DONE = "[✓]   "
+_STATUS_TODO = "[ ]   "
+
+# Title column width in the task list, and where to cut for the ellipsis
+_TITLE_COL = 42
+_TITLE_CUT = _TITLE_COL - 3
+
+# Task list header and separator, pre-joined
+_HEADER = (
+    "ID | Status | Title                                      | Created\n"
+    "---+--------+--------------------------------------------+-------------------"
+)
+
+
+def _stdout_supports_glyphs() -> bool:
+    """
+    Check whether stdout's encoding can represent the output glyphs.
+
+    Returns:
+        True if every non-ASCII glyph used here encodes cleanly
+    """
+    encoding = getattr(sys.stdout, "encoding", None) or "ascii"
+    try:
+        "✓✗─═║╔╗╚╝".encode(encoding)
+    except (UnicodeEncodeError, LookupError):
+        return False
+    return True
+
+
+# Decided once at import: when stdout can't encode the glyphs (e.g. piped
+# to an ASCII/cp1252 destination), rebind every glyph-bearing constant to an
+# ASCII equivalent of the same width so no per-call checks are needed.
+if not _stdout_supports_glyphs():
+    _ASCII_GLYPHS = str.maketrans({
+        "✓": "x", "✗": "x", "─": "-", "═": "=", "║": "|",
+        "╔": "+", "╗": "+", "╚": "+", "╝": "+",
+    })
+    WELCOME_BANNER = WELCOME_BANNER.translate(_ASCII_GLYPHS)
+    HELP_TEXT = HELP_TEXT.translate(_ASCII_GLYPHS)
+    CHECK_MARK = "[x]"
+    _SUCCESS_PREFIX = "[OK] "
+    _ERROR_PREFIX = "[ERROR] "
+    _DETAIL_RULE = _DETAIL_RULE.translate(_ASCII_GLYPHS)
+    _STATUS_DONE = _STATUS_DONE.translate(_ASCII_GLYPHS)
+
+
+def format_welcome() -> str:
+    """Return welcome banner for application startup."""
+    return WELCOME_BANNER
+
 
 def format_goodbye() -> str:
     """Return goodbye message for application exit."""
-    return "Goodbye! Your tasks are not saved (in-memory only)."
+    return GOODBYE_MSG
 
 
 def format_success(message: str) -> str:
@@ -34,7 +139,7 @@ def format_success(message: str) -> str:
     Returns:
         Formatted success message
     """
-    return f"✓ {message}"
+    return _SUCCESS_PREFIX + message
 
 
 def format_error(message: str) -> str:
@@ -47,48 +152,53 @@ def format_error(message: str) -> str:
     Returns:
         Formatted error message
     """
-    return f"✗ Error: {message}"
+    return _ERROR_PREFIX + message
 
 
-def _format_timestamp(iso_timestamp: str) -> str:
+def _truncate_title(title: str) -> str:
     """
-    Convert ISO 8601 timestamp to readable format.
+    Truncate title to the task list's title column width with ellipsis.
 
     Args:
-        iso_timestamp: ISO 8601 timestamp string
+        title: Task title
 
     Returns:
-        Formatted timestamp (YYYY-MM-DD HH:MM)
+        The original title object if it fits, otherwise a truncated
+        copy ending in "..."
     """
-    try:
-        dt = datetime.fromisoformat(iso_timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except (ValueError, AttributeError):
-        return iso_timestamp  # Return as-is if parsing fails
+    return title if len(title) <= _TITLE_COL else title[:_TITLE_CUT] + "..."
 
 
-def _truncate_title(title: str, max_length: int = 50) -> str:
+def _make_row(task: Task) -> str:
     """
-    Truncate title to max length with ellipsis.
+    Format a single task list row.
 
     Args:
-        title: Task title
-        max_length: Maximum length (default 50)
+        task: Task object
 
     Returns:
-        Truncated title with "..." if exceeded
+        Row string with fixed-width ID, status and title cells
     """
-    if len(title) <= max_length:
-        return title
-    return title[:max_length - 3] + "..."
-
-
-def format_task_list(tasks: list[Task]) -> str:
+    # Plain concatenation; fixed-width cells via ljust
+    return (
+        str(task.id).ljust(2)
+        + " | "
+        + (_STATUS_DONE if task.completed else _STATUS_TODO)
+        + " | "
+        + _truncate_title(task.title).ljust(_TITLE_COL)
+        + " | "
+        + task.created_display
+    )
+
+
+def format_task_list(tasks: Collection[Task], completed_count: Optional[int] = None) -> str:
     """
     Format list of tasks as a table.
 
     Args:
-        tasks: List of Task objects
+        tasks: Task objects to show (any sized iterable, e.g. a dict view)
+        completed_count: Number of completed tasks, if already known
+            (avoids rescanning tasks for the summary line)
 
     Returns:
         Formatted table string with headers and summary
@@ -96,32 +206,20 @@ def format_task_list(tasks: list[Task]) -> str:
     if not tasks:
         return "No tasks found. Use 'add' to create your first task."
 
-    # Table header
-    lines = [
-        "ID | Status | Title                                      | Created",
-        "---+--------+--------------------------------------------+-------------------"
-    ]
-
     # Task rows
-    for task in tasks:
-        task_id = str(task["id"])
-        status = "[✓]" if task["completed"] else "[ ]"
-        title = _truncate_title(task["title"], 42)
-        created = _format_timestamp(task["created_at"])
-
-        # Format row with proper spacing
-        row = f"{task_id:2s} | {status:6s} | {title:42s} | {created}"
-        lines.append(row)
+    rows = [_make_row(task) for task in tasks]
 
     # Summary
     total = len(tasks)
-    completed = sum(1 for task in tasks if task["completed"])
+    if completed_count is None:
+        completed = sum(1 for task in tasks if task.completed)
+    else:
+        completed = completed_count
     incomplete = total - completed
 
-    lines.append("")
-    lines.append(f"Total: {total} task{'s' if total != 1 else ''} ({completed} completed, {incomplete} incomplete)")
+    summary = f"Total: {total} task{'s' if total != 1 else ''} ({completed} completed, {incomplete} incomplete)"
 
-    return "\n".join(lines)
+    return _HEADER + "\n" + "\n".join(rows) + "\n\n" + summary
 
 
 def format_task_detail(task: Task) -> str:
@@ -134,15 +232,15 @@ def format_task_detail(task: Task) -> str:
     Returns:
         Formatted detail string
     """
-    status = "Completed" if task["completed"] else "Incomplete"
-    description = task["description"] if task["description"] else "None"
-    created = _format_timestamp(task["created_at"])
-    updated = _format_timestamp(task["updated_at"])
+    status = "Completed" if task.completed else "Incomplete"
+    description = task.description if task.description else "None"
+    created = task.created_display
+    updated = task.updated_display
 
     return f"""Task Details
-────────────────────────────────────────
-ID:          {task["id"]}
-Title:       {task["title"]}
+{_DETAIL_RULE}
+ID:          {task.id}
+Title:       {task.title}
 Description: {description}
 Status:      {status}
 Created:     {created}
@@ -151,47 +249,4 @@ Updated:     {updated}"""
 
 def format_help() -> str:
     """Return comprehensive help text with all commands."""
-    return """
-Todo App - Available Commands
-═══════════════════════════════════════════════════════════════
-
-Task Management:
-  add <title> [description]
-      Create a new task with optional description
-      Example: add "Buy groceries" "Milk, eggs, bread"
-
-  list
-      Display all tasks in a formatted table
-      Example: list
-
-  view <id>
-      Show detailed information for a specific task
-      Example: view 1
-
-  update <id> [--title <title>] [--description <desc>]
-      Update task title and/or description
-      Example: update 1 --title "New title"
-      Example: update 1 --description "New description"
-      Example: update 1 --title "Title" --description "Desc"
-
-  delete <id>
-      Permanently delete a task
-      Example: delete 1
-
-  complete <id>
-      Mark a task as completed
-      Example: complete 1
-
-  uncomplete <id>
-      Mark a task as incomplete
-      Example: uncomplete 1
-
-General:
-  help
-      Show this help message
-
-  exit
-      Exit the application (all data will be lost)
-
-═══════════════════════════════════════════════════════════════
-"""
+    return HELP_TEXT
@@ -4,14 +4,19 @@ Command-line input parsing utilities.
 Parses user input into command name, arguments, and flags.
 """
 import shlex
+import sys
+import warnings
 from typing import Tuple
 
 
-# Valid command names
-VALID_COMMANDS = [
+# Valid command names (frozenset for O(1) membership checks)
+VALID_COMMANDS = frozenset({
     "add", "list", "view", "update", "delete",
     "complete", "uncomplete", "help", "exit"
-]
+})
+
+# Recognized flags, mapped straight to their names
+_KNOWN_FLAGS = {"--title": "title", "--description": "description"}
 
 
 def parse_command(input_str: str) -> Tuple[str, list[str], dict[str, str]]:
@@ -40,12 +45,16 @@ def parse_command(input_str: str) -> Tuple[str, list[str], dict[str, str]]:
     if not input_str.strip():
         return ("", [], {})
 
-    # Use shlex to handle quoted strings properly
-    try:
-        tokens = shlex.split(input_str)
-    except ValueError:
-        # If shlex fails (e.g., unmatched quotes), fall back to simple split
+    if '"' not in input_str and "'" not in input_str and "\\" not in input_str:
+        # No quotes or escapes: shlex would produce the same tokens
         tokens = input_str.split()
+    else:
+        # Use shlex to handle quoted strings properly
+        try:
+            tokens = shlex.split(input_str)
+        except ValueError:
+            # If shlex fails (e.g., unmatched quotes), fall back to simple split
+            tokens = input_str.split()
 
     if not tokens:
         return ("", [], {})
@@ -61,12 +70,15 @@ def parse_command(input_str: str) -> Tuple[str, list[str], dict[str, str]]:
     while i < len(tokens):
         token = tokens[i]
 
-        # Check if token is a flag (starts with --)
-        if token.startswith("--"):
-            flag_name = token[2:]  # Remove --
+        # Check if token is a flag: known flags are a single dict lookup,
+        # any other "--name" token is interned for cheap dict keys
+        flag_name = _KNOWN_FLAGS.get(token)
+        if flag_name is None and token[:2] == "--":
+            flag_name = sys.intern(token[2:])  # Remove --
 
+        if flag_name is not None:
             # Get flag value (next token)
-            if i + 1 < len(tokens) and not tokens[i + 1].startswith("--"):
+            if i + 1 < len(tokens) and tokens[i + 1][:2] != "--":
                 flag_value = tokens[i + 1]
                 flags[flag_name] = flag_value
                 i += 2  # Skip both flag and value
@@ -85,10 +97,22 @@ def is_valid_command(command: str) -> bool:
     """
     Check if command name is valid.
 
+    Deprecated: the CLI validates commands through its dispatch table
+    lookup (see src.main.DISPATCH). Kept for external callers.
+
+    Names returned by parse_command are already lowercased, so they
+    hit the set directly; other input is lowercased only on a miss.
+
     Args:
         command: Command name to validate
 
     Returns:
         True if valid, False otherwise
     """
-    return command.lower() in VALID_COMMANDS
+    warnings.warn(
+        "is_valid_command is deprecated; look the command up in the "
+        "dispatch table instead",
+        DeprecationWarning,
+        stacklevel=2
+    )
+    return command in VALID_COMMANDS or command.lower() in VALID_COMMANDS
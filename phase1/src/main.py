@@ -3,17 +3,30 @@ Main CLI application entry point.
 
 Handles user interaction loop, command routing, and display.
 """
+import sys
+from typing import Callable
+
 from src.task_service import TaskService
 from src.task_repository import TaskRepository
-from src.command_parser import parse_command, is_valid_command
+from src.command_parser import parse_command
 from src.cli_formatter import (
-    format_welcome, format_goodbye, format_help,
+    WELCOME_BANNER, GOODBYE_MSG, HELP_TEXT, CHECK_MARK,
     format_success, format_error,
     format_task_list, format_task_detail
 )
 from src.exceptions import TodoAppError
 
 
+def _emit(*lines: str) -> None:
+    """
+    Write several output lines with a single stdout write.
+
+    Args:
+        lines: Lines to print (newline-terminated on output)
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def handle_add(args: list[str], service: TaskService) -> None:
     """
     Handle 'add' command to create a new task.
@@ -30,12 +43,15 @@ def handle_add(args: list[str], service: TaskService) -> None:
     description = args[1] if len(args) > 1 else ""
 
     task = service.add_task(title, description)
-    print(format_success("Task created successfully"))
-    print(f"  ID: {task['id']}")
-    print(f"  Title: {task['title']}")
-    if task['description']:
-        print(f"  Description: {task['description']}")
-    print(f"  Status: Incomplete")
+    lines = [
+        format_success("Task created successfully"),
+        f"  ID: {task.id}",
+        f"  Title: {task.title}",
+    ]
+    if task.description:
+        lines.append(f"  Description: {task.description}")
+    lines.append("  Status: Incomplete")
+    _emit(*lines)
 
 
 def handle_list(service: TaskService) -> None:
@@ -46,7 +62,7 @@ def handle_list(service: TaskService) -> None:
         service: TaskService instance
     """
     tasks = service.get_all_tasks()
-    print(format_task_list(tasks))
+    print(format_task_list(tasks, service.get_completed_count()))
 
 
 def handle_view(args: list[str], service: TaskService) -> None:
@@ -94,11 +110,14 @@ def handle_update(args: list[str], flags: dict[str, str], service: TaskService)
     description = flags.get("description")
 
     task = service.update_task(task_id, title=title, description=description)
-    print(format_success("Task updated successfully"))
-    print(f"  ID: {task['id']}")
-    print(f"  Title: {task['title']}")
+    lines = [
+        format_success("Task updated successfully"),
+        f"  ID: {task.id}",
+        f"  Title: {task.title}",
+    ]
     if description is not None:
-        print(f"  Description: {task['description']}")
+        lines.append(f"  Description: {task.description}")
+    _emit(*lines)
 
 
 def handle_delete(args: list[str], service: TaskService) -> None:
@@ -120,8 +139,10 @@ def handle_delete(args: list[str], service: TaskService) -> None:
         return
 
     deleted_task = service.delete_task(task_id)
-    print(format_success("Task deleted successfully"))
-    print(f"  Deleted task #{deleted_task['id']}: \"{deleted_task['title']}\"")
+    _emit(
+        format_success("Task deleted successfully"),
+        f"  Deleted task #{deleted_task.id}: \"{deleted_task.title}\""
+    )
 
 
 def handle_complete(args: list[str], service: TaskService) -> None:
@@ -143,8 +164,10 @@ def handle_complete(args: list[str], service: TaskService) -> None:
         return
 
     task = service.complete_task(task_id)
-    print(format_success("Task marked as complete"))
-    print(f"  Task #{task['id']}: \"{task['title']}\" ✓")
+    _emit(
+        format_success("Task marked as complete"),
+        f"  Task #{task.id}: \"{task.title}\" {CHECK_MARK}"
+    )
 
 
 def handle_uncomplete(args: list[str], service: TaskService) -> None:
@@ -166,13 +189,31 @@ def handle_uncomplete(args: list[str], service: TaskService) -> None:
         return
 
     task = service.uncomplete_task(task_id)
-    print(format_success("Task marked as incomplete"))
-    print(f"  Task #{task['id']}: \"{task['title']}\" [ ]")
+    _emit(
+        format_success("Task marked as incomplete"),
+        f"  Task #{task.id}: \"{task.title}\" [ ]"
+    )
 
 
 def handle_help() -> None:
     """Handle 'help' command to show usage information."""
-    print(format_help())
+    print(HELP_TEXT)
+
+
+# Every handler adapted to one signature: (args, flags, service) -> None
+CommandHandler = Callable[[list[str], dict[str, str], TaskService], None]
+
+# Command dispatch table: name -> handler
+DISPATCH: dict[str, CommandHandler] = {
+    "add": lambda args, flags, service: handle_add(args, service),
+    "list": lambda args, flags, service: handle_list(service),
+    "view": lambda args, flags, service: handle_view(args, service),
+    "update": handle_update,
+    "delete": lambda args, flags, service: handle_delete(args, service),
+    "complete": lambda args, flags, service: handle_complete(args, service),
+    "uncomplete": lambda args, flags, service: handle_uncomplete(args, service),
+    "help": lambda args, flags, service: handle_help(),
+}
 
 
 def main() -> None:
@@ -180,7 +221,7 @@ def main() -> None:
     repository = TaskRepository()
     service = TaskService(repository)
 
-    print(format_welcome())
+    print(WELCOME_BANNER)
 
     while True:
         try:
@@ -192,35 +233,21 @@ def main() -> None:
             command, args, flags = parse_command(user_input)
 
             if command == "exit":
-                print(format_goodbye())
+                print(GOODBYE_MSG)
                 break
 
-            if not is_valid_command(command):
+            # One lookup both validates the command and finds its handler
+            handler = DISPATCH.get(command)
+            if handler is None:
                 print(format_error(f"Unknown command '{command}'. Type 'help' for available commands."))
                 continue
 
-            # Route to appropriate handler
-            if command == "add":
-                handle_add(args, service)
-            elif command == "list":
-                handle_list(service)
-            elif command == "view":
-                handle_view(args, service)
-            elif command == "update":
-                handle_update(args, flags, service)
-            elif command == "delete":
-                handle_delete(args, service)
-            elif command == "complete":
-                handle_complete(args, service)
-            elif command == "uncomplete":
-                handle_uncomplete(args, service)
-            elif command == "help":
-                handle_help()
+            handler(args, flags, service)
 
         except TodoAppError as e:
             print(format_error(str(e)))
         except KeyboardInterrupt:
-            print("\n" + format_goodbye())
+            print("\n" + GOODBYE_MSG)
             break
         except Exception as e:
             print(format_error(f"An unexpected error occurred: {e}"))
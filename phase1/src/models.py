@@ -3,18 +3,25 @@ Data models and type definitions for the Todo application.
 
 This module defines the core Task entity and validation constants.
 """
-from typing import TypedDict
+from dataclasses import dataclass
 
 
 # Validation constants
 MAX_TITLE_LENGTH = 200
 MAX_DESCRIPTION_LENGTH = 1000
 
+# Display format for timestamps in CLI output
+DISPLAY_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
 
-class Task(TypedDict):
+
+@dataclass(slots=True)
+class Task:
     """
     Represents a single Todo task.
 
+    Slotted so each instance stores its fields in a fixed array rather
+    than a per-instance dict, keeping large task lists compact.
+
     Attributes:
         id: Unique integer identifier (auto-generated, immutable)
         title: Short task title (required, 1-200 characters)
@@ -22,6 +29,8 @@ class Task(TypedDict):
         completed: Boolean flag indicating completion status
         created_at: ISO 8601 timestamp of task creation (immutable)
         updated_at: ISO 8601 timestamp of last modification
+        created_display: created_at preformatted for display (YYYY-MM-DD HH:MM)
+        updated_display: updated_at preformatted for display (YYYY-MM-DD HH:MM)
     """
     id: int
     title: str
@@ -29,3 +38,5 @@ class Task(TypedDict):
     completed: bool
     created_at: str
     updated_at: str
+    created_display: str
+    updated_display: str
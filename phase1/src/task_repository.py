@@ -4,7 +4,7 @@ Data access layer for task storage.
 Manages in-memory storage of tasks using a dictionary.
 Provides CRUD operations without business logic.
 """
-from typing import Optional
+from typing import Collection, Iterable, Optional
 
 from src.models import Task
 
@@ -14,13 +14,26 @@ class TaskRepository:
     Manages in-memory storage and retrieval of tasks.
 
     Storage is a dictionary mapping task IDs to Task objects.
-    IDs are auto-incremented starting from 1.
+    IDs are auto-incremented starting from 1. A running count of
+    completed tasks is kept so summaries never need a full scan;
+    completion changes must go through set_completed to keep it exact.
     """
 
     def __init__(self) -> None:
-        """Initialize empty storage and ID counter."""
+        """Initialize empty storage, ID counter and completed counter."""
         self._storage: dict[int, Task] = {}
         self._next_id: int = 1
+        self._completed_count: int = 0
+
+    @property
+    def completed_count(self) -> int:
+        """Number of stored tasks marked as completed."""
+        return self._completed_count
+
+    @property
+    def total_count(self) -> int:
+        """Number of stored tasks."""
+        return len(self._storage)
 
     def generate_id(self) -> int:
         """
@@ -43,9 +56,29 @@ class TaskRepository:
         Returns:
             The stored task
         """
-        self._storage[task["id"]] = task
+        self._storage[task.id] = task
+        if task.completed:
+            self._completed_count += 1
         return task
 
+    def bulk_load(self, tasks: Iterable[Task]) -> None:
+        """
+        Store several existing tasks at once.
+
+        Tasks must be given in ascending ID order, with IDs above any
+        already stored, so find_all keeps returning tasks by ID. The ID
+        counter is advanced past the highest loaded ID.
+
+        Args:
+            tasks: Task objects to store (each must have an 'id' field)
+        """
+        loaded = {task.id: task for task in tasks}
+        if not loaded:
+            return
+        self._storage.update(loaded)
+        self._completed_count += sum(1 for task in loaded.values() if task.completed)
+        self._next_id = max(self._next_id, max(loaded) + 1)
+
     def find_by_id(self, task_id: int) -> Optional[Task]:
         """
         Retrieve task by ID.
@@ -58,14 +91,21 @@ class TaskRepository:
         """
         return self._storage.get(task_id)
 
-    def find_all(self) -> list[Task]:
+    def find_all(self) -> Collection[Task]:
         """
         Retrieve all tasks sorted by ID.
 
+        No sort is needed: generate_id only ever increases and dicts
+        preserve insertion order, so storage order is already ID order.
+        Revisit if IDs are ever reissued or inserted out of order.
+
+        The result is a live view of storage, not a copy: iterate it or
+        take its len() right away, and don't hold it across mutations.
+
         Returns:
-            List of all tasks, sorted by ID ascending
+            All tasks in ID ascending order
         """
-        return [self._storage[task_id] for task_id in sorted(self._storage.keys())]
+        return self._storage.values()
 
     def update(self, task_id: int, task: Task) -> Task:
         """
@@ -81,6 +121,25 @@ class TaskRepository:
         self._storage[task_id] = task
         return task
 
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """
+        Set a task's completion status and adjust the completed counter.
+
+        Args:
+            task_id: ID of task to update
+            completed: New completion status
+
+        Returns:
+            Updated task if found, None otherwise
+        """
+        task = self._storage.get(task_id)
+        if task is None:
+            return None
+        if task.completed != completed:
+            self._completed_count += 1 if completed else -1
+            task.completed = completed
+        return task
+
     def delete(self, task_id: int) -> bool:
         """
         Delete task from storage.
@@ -91,10 +150,12 @@ class TaskRepository:
         Returns:
             True if task existed and was deleted, False otherwise
         """
-        if task_id in self._storage:
-            del self._storage[task_id]
-            return True
-        return False
+        task = self._storage.pop(task_id, None)
+        if task is None:
+            return False
+        if task.completed:
+            self._completed_count -= 1
+        return True
 
     def clear(self) -> None:
         """
@@ -104,3 +165,4 @@ class TaskRepository:
         """
         self._storage.clear()
         self._next_id = 1
+        self._completed_count = 0
@@ -5,13 +5,24 @@ Contains all domain validation, business rules, and orchestration
 of repository calls. No direct storage access.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Collection, Optional
 
-from src.models import Task, MAX_TITLE_LENGTH, MAX_DESCRIPTION_LENGTH
+from src.models import (
+    Task, MAX_TITLE_LENGTH, MAX_DESCRIPTION_LENGTH, DISPLAY_TIMESTAMP_FORMAT
+)
 from src.task_repository import TaskRepository
 from src.exceptions import ValidationError, TaskNotFoundError
 
 
+def _now() -> datetime:
+    """
+    Return the current local time.
+
+    Default clock for TaskService; module-level so tests can patch it.
+    """
+    return datetime.now()
+
+
 class TaskService:
     """
     Service layer for task management operations.
@@ -19,14 +30,21 @@ class TaskService:
     Handles business logic, validation, and coordinates repository calls.
     """
 
-    def __init__(self, repository: TaskRepository) -> None:
+    def __init__(
+        self,
+        repository: TaskRepository,
+        clock: Optional[Callable[[], datetime]] = None
+    ) -> None:
         """
         Initialize service with repository.
 
         Args:
             repository: TaskRepository instance for data access
+            clock: Callable returning the current datetime (defaults to
+                the module-level _now)
         """
         self.repository = repository
+        self._clock = clock
 
     def _validate_title(self, title: str) -> str:
         """
@@ -41,15 +59,17 @@ class TaskService:
         Raises:
             ValidationError: If title is empty or too long
         """
-        stripped = title.strip()
-        if not stripped:
+        if not title or title.isspace():
             raise ValidationError("Task title cannot be empty")
-        if len(stripped) > MAX_TITLE_LENGTH:
+        # Only allocate a stripped copy when there is whitespace to remove
+        if title[0].isspace() or title[-1].isspace():
+            title = title.strip()
+        if len(title) > MAX_TITLE_LENGTH:
             raise ValidationError(
                 f"Task title cannot exceed {MAX_TITLE_LENGTH} characters "
-                f"(got {len(stripped)})"
+                f"(got {len(title)})"
             )
-        return stripped
+        return title
 
     def _validate_description(self, description: str) -> str:
         """
@@ -71,14 +91,18 @@ class TaskService:
             )
         return description
 
-    def _generate_timestamp(self) -> str:
+    def _now_strings(self) -> tuple[str, str]:
         """
-        Generate ISO 8601 timestamp for current time.
+        Generate ISO 8601 and display timestamps for the current time.
+
+        Both strings come from a single clock reading, so the display
+        form never has to be re-parsed from the ISO string.
 
         Returns:
-            Timestamp string in ISO 8601 format
+            Tuple of (ISO 8601 timestamp, display timestamp)
         """
-        return datetime.now().isoformat()
+        now = self._clock() if self._clock is not None else _now()
+        return now.isoformat(), now.strftime(DISPLAY_TIMESTAMP_FORMAT)
 
     def add_task(self, title: str, description: str = "") -> Task:
         """
@@ -104,27 +128,30 @@ class TaskService:
 
         # Generate ID and timestamps
         task_id = self.repository.generate_id()
-        timestamp = self._generate_timestamp()
+        timestamp, display = self._now_strings()
 
         # Create task object
-        task: Task = {
-            "id": task_id,
-            "title": validated_title,
-            "description": validated_description,
-            "completed": False,
-            "created_at": timestamp,
-            "updated_at": timestamp
-        }
+        task = Task(
+            id=task_id,
+            title=validated_title,
+            description=validated_description,
+            completed=False,
+            created_at=timestamp,
+            updated_at=timestamp,
+            created_display=display,
+            updated_display=display
+        )
 
         # Store and return
         return self.repository.create(task)
 
-    def get_all_tasks(self) -> list[Task]:
+    def get_all_tasks(self) -> Collection[Task]:
         """
         Retrieve all tasks sorted by ID.
 
         Returns:
-            List of all tasks, sorted by ID ascending
+            Live view of all tasks in ID ascending order (see
+            TaskRepository.find_all)
 
         Examples:
             >>> tasks = service.get_all_tasks()
@@ -132,6 +159,15 @@ class TaskService:
         """
         return self.repository.find_all()
 
+    def get_completed_count(self) -> int:
+        """
+        Count completed tasks without scanning storage.
+
+        Returns:
+            Number of tasks marked as completed
+        """
+        return self.repository.completed_count
+
     def get_task_by_id(self, task_id: int) -> Task:
         """
         Retrieve a specific task by ID.
@@ -147,7 +183,7 @@ class TaskService:
 
         Examples:
             >>> task = service.get_task_by_id(1)
-            >>> print(task["title"])
+            >>> print(task.title)
         """
         task = self.repository.find_by_id(task_id)
         if task is None:
@@ -191,14 +227,14 @@ class TaskService:
 
         # Validate and update title if provided
         if title is not None:
-            task["title"] = self._validate_title(title)
+            task.title = self._validate_title(title)
 
         # Validate and update description if provided
         if description is not None:
-            task["description"] = self._validate_description(description)
+            task.description = self._validate_description(description)
 
         # Update timestamp
-        task["updated_at"] = self._generate_timestamp()
+        task.updated_at, task.updated_display = self._now_strings()
 
         # Store and return
         return self.repository.update(task_id, task)
@@ -218,7 +254,7 @@ class TaskService:
 
         Examples:
             >>> deleted = service.delete_task(1)
-            >>> print(f"Deleted: {deleted['title']}")
+            >>> print(f"Deleted: {deleted.title}")
         """
         # Retrieve task first (for return value and validation)
         task = self.get_task_by_id(task_id)  # Raises TaskNotFoundError if not found
@@ -247,14 +283,14 @@ class TaskService:
 
         Examples:
             >>> task = service.complete_task(1)
-            >>> print(f"Status: {task['completed']}")  # True
+            >>> print(f"Status: {task.completed}")  # True
         """
         # Retrieve task
         task = self.get_task_by_id(task_id)
 
-        # Update completion status
-        task["completed"] = True
-        task["updated_at"] = self._generate_timestamp()
+        # Update completion status (keeps repository counters in sync)
+        self.repository.set_completed(task_id, True)
+        task.updated_at, task.updated_display = self._now_strings()
 
         # Store and return
         return self.repository.update(task_id, task)
@@ -278,14 +314,14 @@ class TaskService:
 
         Examples:
             >>> task = service.uncomplete_task(1)
-            >>> print(f"Status: {task['completed']}")  # False
+            >>> print(f"Status: {task.completed}")  # False
         """
         # Retrieve task
         task = self.get_task_by_id(task_id)
 
-        # Update completion status
-        task["completed"] = False
-        task["updated_at"] = self._generate_timestamp()
+        # Update completion status (keeps repository counters in sync)
+        self.repository.set_completed(task_id, False)
+        task.updated_at, task.updated_display = self._now_strings()
 
         # Store and return
         return self.repository.update(task_id, task)
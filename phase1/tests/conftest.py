@@ -3,65 +3,130 @@ Pytest configuration and shared fixtures.
 
 Provides reusable test fixtures for repository and service instances.
 """
+import itertools
+from dataclasses import replace
+from datetime import datetime, timedelta
+
 import pytest
+from src.models import Task
 from src.task_repository import TaskRepository
 from src.task_service import TaskService
 
 
 @pytest.fixture
 def empty_repository():
-    """Provide a fresh, empty repository for each test."""
-    repo = TaskRepository()
-    repo.clear()
-    return repo
+    """
+    Provide a fresh, empty repository for each test.
+
+    A new TaskRepository already starts with empty storage and next ID 1,
+    the same state clear() produces, so no extra reset is needed.
+    """
+    return TaskRepository()
+
+
+@pytest.fixture(scope="module")
+def _task_seed():
+    """Provide the 3 sample tasks, built once per test module."""
+    return (
+        Task(
+            id=1,
+            title="Task 1",
+            description="Description 1",
+            completed=False,
+            created_at="2025-01-01T10:00:00",
+            updated_at="2025-01-01T10:00:00",
+            created_display="2025-01-01 10:00",
+            updated_display="2025-01-01 10:00"
+        ),
+        Task(
+            id=2,
+            title="Task 2",
+            description="",
+            completed=True,
+            created_at="2025-01-01T11:00:00",
+            updated_at="2025-01-01T11:00:00",
+            created_display="2025-01-01 11:00",
+            updated_display="2025-01-01 11:00"
+        ),
+        Task(
+            id=3,
+            title="Task 3",
+            description="Description 3",
+            completed=False,
+            created_at="2025-01-01T12:00:00",
+            updated_at="2025-01-01T12:00:00",
+            created_display="2025-01-01 12:00",
+            updated_display="2025-01-01 12:00"
+        ),
+    )
 
 
 @pytest.fixture
-def repository_with_tasks(empty_repository):
-    """Provide a repository with 3 sample tasks."""
-    repo = empty_repository
-
-    # Create sample tasks directly in repository
-    task1 = {
-        "id": 1,
-        "title": "Task 1",
-        "description": "Description 1",
-        "completed": False,
-        "created_at": "2025-01-01T10:00:00",
-        "updated_at": "2025-01-01T10:00:00"
-    }
-    task2 = {
-        "id": 2,
-        "title": "Task 2",
-        "description": "",
-        "completed": True,
-        "created_at": "2025-01-01T11:00:00",
-        "updated_at": "2025-01-01T11:00:00"
-    }
-    task3 = {
-        "id": 3,
-        "title": "Task 3",
-        "description": "Description 3",
-        "completed": False,
-        "created_at": "2025-01-01T12:00:00",
-        "updated_at": "2025-01-01T12:00:00"
-    }
-
-    repo.create(task1)
-    repo.create(task2)
-    repo.create(task3)
-    repo._next_id = 4  # Set next ID to 4
+def repository_with_tasks(empty_repository, _task_seed):
+    """
+    Provide a repository with 3 sample tasks.
 
+    Each test gets fresh copies of the seed tasks, so mutating tests
+    cannot leak changes into the shared seed.
+    """
+    empty_repository.bulk_load(replace(task) for task in _task_seed)  # Next ID becomes 4
+    return empty_repository
+
+
+@pytest.fixture(scope="module")
+def readonly_repository_with_tasks(_task_seed):
+    """
+    Provide a module-wide repository with the 3 sample tasks.
+
+    Only for tests that never modify the repository or its tasks.
+    """
+    repo = TaskRepository()
+    repo.bulk_load(replace(task) for task in _task_seed)
     return repo
 
 
+@pytest.fixture(scope="module")
+def _module_task_service():
+    """Provide one TaskService per test module (see task_service)."""
+    return TaskService(TaskRepository())
+
+
 @pytest.fixture
-def task_service(empty_repository):
-    """Provide a TaskService with empty repository."""
-    return TaskService(empty_repository)
+def task_service(_module_task_service):
+    """
+    Provide a TaskService with empty repository.
+
+    The service is built once per module and its repository is cleared
+    before each test, so tests still see an empty store starting at ID 1.
+    """
+    _module_task_service.repository.clear()
+    yield _module_task_service
+    _module_task_service.repository.clear()
 
 
 @pytest.fixture
 def task_service_with_data(repository_with_tasks):
     """Provide a TaskService with sample data."""
     return TaskService(repository_with_tasks)
+
+
+@pytest.fixture(scope="module")
+def readonly_service_with_data(readonly_repository_with_tasks):
+    """Provide a module-wide TaskService over the read-only sample data."""
+    return TaskService(readonly_repository_with_tasks)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """
+    Make TaskService timestamps advance one second per reading.
+
+    Lets timestamp tests observe distinct values without sleeping.
+    """
+    ticks = itertools.count()
+    start = datetime(2025, 1, 1, 10, 0, 0)
+
+    def fake_now():
+        return start + timedelta(seconds=next(ticks))
+
+    monkeypatch.setattr("src.task_service._now", fake_now)
@@ -4,17 +4,24 @@ Integration tests for complete user workflows.
 Tests end-to-end scenarios across all layers.
 """
 import pytest
-import time
 from src.task_service import TaskService
 from src.task_repository import TaskRepository
 
 
-@pytest.fixture
-def fresh_service():
-    """Provide a fresh service for each integration test."""
+@pytest.fixture(scope="module")
+def _integration_service():
+    """Build the integration test service once per module."""
     return TaskService(TaskRepository())
 
 
+@pytest.fixture
+def fresh_service(_integration_service):
+    """Provide a fresh (reset) service for each integration test."""
+    _integration_service.repository.clear()
+    yield _integration_service
+    _integration_service.repository.clear()
+
+
 def test_complete_user_workflow(fresh_service):
     """
     Test complete user workflow: add → view → update → complete → delete.
@@ -25,9 +32,9 @@ def test_complete_user_workflow(fresh_service):
 
     # Add task
     task = service.add_task("Buy groceries", "Milk and eggs")
-    assert task["id"] == 1
-    assert task["title"] == "Buy groceries"
-    assert task["completed"] is False
+    assert task.id == 1
+    assert task.title == "Buy groceries"
+    assert task.completed is False
 
     # View all tasks
     tasks = service.get_all_tasks()
@@ -35,19 +42,19 @@ def test_complete_user_workflow(fresh_service):
 
     # View task detail
     retrieved = service.get_task_by_id(1)
-    assert retrieved["title"] == "Buy groceries"
+    assert retrieved.title == "Buy groceries"
 
     # Update task
     updated = service.update_task(1, title="Buy groceries and snacks")
-    assert updated["title"] == "Buy groceries and snacks"
+    assert updated.title == "Buy groceries and snacks"
 
     # Complete task
     completed = service.complete_task(1)
-    assert completed["completed"] is True
+    assert completed.completed is True
 
     # Delete task
     deleted = service.delete_task(1)
-    assert deleted["id"] == 1
+    assert deleted.id == 1
 
     # Verify deletion
     tasks = service.get_all_tasks()
@@ -83,7 +90,7 @@ def test_multiple_tasks_management(fresh_service):
     assert len(tasks) == 8
 
     # Count completed tasks
-    completed_count = sum(1 for task in tasks if task["completed"])
+    completed_count = sum(1 for task in tasks if task.completed)
     assert completed_count == 5
 
 
@@ -101,7 +108,7 @@ def test_error_recovery(fresh_service):
 
     # Application should still work
     task = service.add_task("Valid task")
-    assert task["id"] == 1
+    assert task.id == 1
 
 
 def test_task_independence(fresh_service):
@@ -122,17 +129,17 @@ def test_task_independence(fresh_service):
 
     # Verify task 1 unchanged
     retrieved1 = service.get_task_by_id(1)
-    assert retrieved1["title"] == "Task 1"
-    assert retrieved1["description"] == "Desc 1"
+    assert retrieved1.title == "Task 1"
+    assert retrieved1.description == "Desc 1"
 
     # Verify task 3 unchanged
     retrieved3 = service.get_task_by_id(3)
-    assert retrieved3["title"] == "Task 3"
-    assert retrieved3["description"] == "Desc 3"
+    assert retrieved3.title == "Task 3"
+    assert retrieved3.description == "Desc 3"
 
     # Verify task 2 changed
     retrieved2 = service.get_task_by_id(2)
-    assert retrieved2["title"] == "Updated Task 2"
+    assert retrieved2.title == "Updated Task 2"
 
 
 def test_idempotent_operations(fresh_service):
@@ -150,17 +157,17 @@ def test_idempotent_operations(fresh_service):
     service.complete_task(1)  # Should not error
 
     retrieved = service.get_task_by_id(1)
-    assert retrieved["completed"] is True
+    assert retrieved.completed is True
 
     # Mark incomplete twice
     service.uncomplete_task(1)
     service.uncomplete_task(1)  # Should not error
 
     retrieved = service.get_task_by_id(1)
-    assert retrieved["completed"] is False
+    assert retrieved.completed is False
 
 
-def test_timestamp_behavior(fresh_service):
+def test_timestamp_behavior(fresh_service, fake_clock):
     """
     Test that timestamps behave correctly.
 
@@ -169,17 +176,14 @@ def test_timestamp_behavior(fresh_service):
     service = fresh_service
 
     task = service.add_task("Test Task")
-    original_created = task["created_at"]
-    original_updated = task["updated_at"]
-
-    # Wait briefly to ensure timestamp difference
-    time.sleep(0.01)
+    original_created = task.created_at
+    original_updated = task.updated_at
 
     # Update task
     updated = service.update_task(1, title="New Title")
 
     # created_at should be unchanged
-    assert updated["created_at"] == original_created
+    assert updated.created_at == original_created
 
     # updated_at should be different
-    assert updated["updated_at"] != original_updated
+    assert updated.updated_at != original_updated
@@ -1,48 +1,66 @@
 """
 Unit tests for data models.
 
-Tests Task TypedDict structure and validation constants.
+Tests Task dataclass structure and validation constants.
 """
+from dataclasses import fields
+
+import pytest
+
 from src.models import Task, MAX_TITLE_LENGTH, MAX_DESCRIPTION_LENGTH
 
 
-def test_task_has_all_required_fields():
-    """Verify Task TypedDict has all 6 required fields."""
-    # Create a valid task
-    task: Task = {
+def _make_task(**overrides) -> Task:
+    """Build a valid Task, overriding any fields given."""
+    values = {
         "id": 1,
         "title": "Test",
         "description": "Test description",
         "completed": False,
         "created_at": "2025-01-01T10:00:00",
-        "updated_at": "2025-01-01T10:00:00"
+        "updated_at": "2025-01-01T10:00:00",
+        "created_display": "2025-01-01 10:00",
+        "updated_display": "2025-01-01 10:00",
     }
+    values.update(overrides)
+    return Task(**values)
 
-    assert "id" in task
-    assert "title" in task
-    assert "description" in task
-    assert "completed" in task
-    assert "created_at" in task
-    assert "updated_at" in task
+
+def test_task_has_all_required_fields():
+    """Verify Task dataclass has all 8 required fields."""
+    assert [f.name for f in fields(Task)] == [
+        "id",
+        "title",
+        "description",
+        "completed",
+        "created_at",
+        "updated_at",
+        "created_display",
+        "updated_display",
+    ]
 
 
 def test_task_field_types():
     """Verify Task field types are correct."""
-    task: Task = {
-        "id": 1,
-        "title": "Test",
-        "description": "Desc",
-        "completed": True,
-        "created_at": "2025-01-01T10:00:00",
-        "updated_at": "2025-01-01T10:00:00"
-    }
+    task = _make_task(description="Desc", completed=True)
+
+    assert isinstance(task.id, int)
+    assert isinstance(task.title, str)
+    assert isinstance(task.description, str)
+    assert isinstance(task.completed, bool)
+    assert isinstance(task.created_at, str)
+    assert isinstance(task.updated_at, str)
+    assert isinstance(task.created_display, str)
+    assert isinstance(task.updated_display, str)
+
+
+def test_task_uses_slots():
+    """Verify Task instances have no per-instance __dict__."""
+    task = _make_task()
 
-    assert isinstance(task["id"], int)
-    assert isinstance(task["title"], str)
-    assert isinstance(task["description"], str)
-    assert isinstance(task["completed"], bool)
-    assert isinstance(task["created_at"], str)
-    assert isinstance(task["updated_at"], str)
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.unknown_field = "value"
 
 
 def test_constants():
@@ -4,6 +4,7 @@ Unit tests for TaskRepository (data access layer).
 Tests CRUD operations and ID generation.
 """
 import pytest
+from src.models import Task
 from src.task_repository import TaskRepository
 
 
@@ -18,26 +19,28 @@ def test_generate_unique_ids(empty_repository):
 def test_create_task(empty_repository):
     """Test task creation and storage."""
     repo = empty_repository
-    task = {
-        "id": 1,
-        "title": "Test Task",
-        "description": "Test Description",
-        "completed": False,
-        "created_at": "2025-01-01T10:00:00",
-        "updated_at": "2025-01-01T10:00:00"
-    }
+    task = Task(
+        id=1,
+        title="Test Task",
+        description="Test Description",
+        completed=False,
+        created_at="2025-01-01T10:00:00",
+        updated_at="2025-01-01T10:00:00",
+        created_display="2025-01-01 10:00",
+        updated_display="2025-01-01 10:00"
+    )
     created = repo.create(task)
-    assert created["id"] == 1
-    assert created["title"] == "Test Task"
+    assert created.id == 1
+    assert created.title == "Test Task"
 
 
-def test_find_by_id_existing(repository_with_tasks):
+def test_find_by_id_existing(readonly_repository_with_tasks):
     """Test retrieving an existing task by ID."""
-    repo = repository_with_tasks
+    repo = readonly_repository_with_tasks
     task = repo.find_by_id(2)
     assert task is not None
-    assert task["id"] == 2
-    assert task["title"] == "Task 2"
+    assert task.id == 2
+    assert task.title == "Task 2"
 
 
 def test_find_by_id_not_found(empty_repository):
@@ -48,33 +51,32 @@ def test_find_by_id_not_found(empty_repository):
 
 
 def test_find_all_empty(empty_repository):
-    """Test finding all tasks in empty repository returns empty list."""
+    """Test finding all tasks in empty repository returns no tasks."""
     repo = empty_repository
     tasks = repo.find_all()
-    assert tasks == []
+    assert len(tasks) == 0
+    assert list(tasks) == []
 
 
-def test_find_all_multiple(repository_with_tasks):
+def test_find_all_multiple(readonly_repository_with_tasks):
     """Test retrieving all tasks returns them sorted by ID."""
-    repo = repository_with_tasks
+    repo = readonly_repository_with_tasks
     tasks = repo.find_all()
     assert len(tasks) == 3
-    assert tasks[0]["id"] == 1
-    assert tasks[1]["id"] == 2
-    assert tasks[2]["id"] == 3
+    assert [task.id for task in tasks] == [1, 2, 3]
 
 
 def test_update_task(repository_with_tasks):
     """Test updating an existing task."""
     repo = repository_with_tasks
     task = repo.find_by_id(1)
-    task["title"] = "Updated Title"
+    task.title = "Updated Title"
     updated = repo.update(1, task)
-    assert updated["title"] == "Updated Title"
+    assert updated.title == "Updated Title"
 
     # Verify it's persisted
     retrieved = repo.find_by_id(1)
-    assert retrieved["title"] == "Updated Title"
+    assert retrieved.title == "Updated Title"
 
 
 def test_delete_task_existing(repository_with_tasks):
@@ -87,8 +89,90 @@ def test_delete_task_existing(repository_with_tasks):
     assert repo.find_by_id(2) is None
 
 
+def test_find_all_keeps_id_order_after_delete(repository_with_tasks):
+    """Test that find_all stays in ID order across deletes and creates."""
+    repo = repository_with_tasks
+    repo.delete(2)
+    task = repo.find_by_id(1)
+    repo.create(Task(
+        id=repo.generate_id(),
+        title="Task 4",
+        description="",
+        completed=False,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        created_display=task.created_display,
+        updated_display=task.updated_display
+    ))
+    assert [task.id for task in repo.find_all()] == [1, 3, 4]
+
+
 def test_delete_task_nonexistent(empty_repository):
     """Test deleting a non-existent task returns False."""
     repo = empty_repository
     result = repo.delete(999)
     assert result is False
+
+
+def test_counts_track_create_and_delete(repository_with_tasks):
+    """Test that total and completed counts follow creates and deletes."""
+    repo = repository_with_tasks
+    assert repo.total_count == 3
+    assert repo.completed_count == 1  # Task 2 is completed
+
+    repo.delete(2)
+    assert repo.total_count == 2
+    assert repo.completed_count == 0
+
+
+def test_set_completed_adjusts_count(repository_with_tasks):
+    """Test that set_completed updates the task and the completed count."""
+    repo = repository_with_tasks
+    task = repo.set_completed(1, True)
+    assert task.completed is True
+    assert repo.completed_count == 2
+
+    # Setting the same value again leaves the count unchanged
+    repo.set_completed(1, True)
+    assert repo.completed_count == 2
+
+    repo.set_completed(2, False)
+    assert repo.completed_count == 1
+
+
+def test_set_completed_nonexistent(empty_repository):
+    """Test that set_completed on a missing task returns None."""
+    repo = empty_repository
+    assert repo.set_completed(999, True) is None
+    assert repo.completed_count == 0
+
+
+def test_bulk_load(empty_repository):
+    """Test bulk loading tasks stores them and advances the ID counter."""
+    repo = empty_repository
+    repo.bulk_load([
+        Task(
+            id=1,
+            title="Loaded 1",
+            description="",
+            completed=True,
+            created_at="2025-01-01T10:00:00",
+            updated_at="2025-01-01T10:00:00",
+            created_display="2025-01-01 10:00",
+            updated_display="2025-01-01 10:00"
+        ),
+        Task(
+            id=2,
+            title="Loaded 2",
+            description="",
+            completed=False,
+            created_at="2025-01-01T11:00:00",
+            updated_at="2025-01-01T11:00:00",
+            created_display="2025-01-01 11:00",
+            updated_display="2025-01-01 11:00"
+        ),
+    ])
+
+    assert [task.id for task in repo.find_all()] == [1, 2]
+    assert repo.completed_count == 1
+    assert repo.generate_id() == 3
@@ -4,7 +4,8 @@ Unit tests for TaskService (business logic layer).
 Tests validation, business rules, and service operations.
 """
 import pytest
-import time
+from datetime import datetime
+from src.task_repository import TaskRepository
 from src.task_service import TaskService
 from src.exceptions import ValidationError, TaskNotFoundError
 
@@ -13,69 +14,69 @@ from src.exceptions import ValidationError, TaskNotFoundError
 def test_add_task_with_title_and_description(task_service):
     """Test creating a task with both title and description."""
     task = task_service.add_task("Buy groceries", "Milk and eggs")
-    assert task["id"] == 1
-    assert task["title"] == "Buy groceries"
-    assert task["description"] == "Milk and eggs"
-    assert task["completed"] is False
+    assert task.id == 1
+    assert task.title == "Buy groceries"
+    assert task.description == "Milk and eggs"
+    assert task.completed is False
 
 
 def test_add_task_with_title_only(task_service):
     """Test creating a task with title only (empty description)."""
     task = task_service.add_task("Quick task")
-    assert task["title"] == "Quick task"
-    assert task["description"] == ""
+    assert task.title == "Quick task"
+    assert task.description == ""
 
 
 def test_add_task_strips_whitespace(task_service):
     """Test that title whitespace is stripped."""
     task = task_service.add_task("  Spaced Title  ")
-    assert task["title"] == "Spaced Title"
-
-
-def test_add_task_empty_title_raises_error(task_service):
-    """Test that empty title raises ValidationError."""
+    assert task.title == "Spaced Title"
+
+
+def test_add_task_title_length_checked_after_strip(task_service):
+    """Test that surrounding whitespace doesn't count toward the limit."""
+    task = task_service.add_task("  " + "a" * 200 + "  ")
+    assert task.title == "a" * 200
+
+
+@pytest.mark.parametrize(
+    "title, description, expected_message",
+    [
+        ("", "", "cannot be empty"),
+        ("   ", "", "cannot be empty"),
+        ("a" * 201, "", "cannot exceed 200 characters"),
+        ("Title", "a" * 1001, "cannot exceed 1000 characters"),
+    ],
+    ids=["empty_title", "whitespace_title", "title_too_long", "description_too_long"],
+)
+def test_add_task_invalid_input_raises_error(
+    task_service, title, description, expected_message
+):
+    """Test that invalid title or description raises ValidationError."""
     with pytest.raises(ValidationError) as exc_info:
-        task_service.add_task("")
-    assert "cannot be empty" in str(exc_info.value)
-
-
-def test_add_task_title_too_long_raises_error(task_service):
-    """Test that title exceeding 200 characters raises ValidationError."""
-    long_title = "a" * 201
-    with pytest.raises(ValidationError) as exc_info:
-        task_service.add_task(long_title)
-    assert "cannot exceed 200 characters" in str(exc_info.value)
-
-
-def test_add_task_description_too_long_raises_error(task_service):
-    """Test that description exceeding 1000 characters raises ValidationError."""
-    long_desc = "a" * 1001
-    with pytest.raises(ValidationError) as exc_info:
-        task_service.add_task("Title", long_desc)
-    assert "cannot exceed 1000 characters" in str(exc_info.value)
+        task_service.add_task(title, description)
+    assert expected_message in str(exc_info.value)
 
 
 # Get Tasks Tests
 def test_get_all_tasks_empty(task_service):
-    """Test getting all tasks from empty service returns empty list."""
+    """Test getting all tasks from empty service returns no tasks."""
     tasks = task_service.get_all_tasks()
-    assert tasks == []
+    assert list(tasks) == []
 
 
-def test_get_all_tasks_multiple_sorted(task_service_with_data):
+def test_get_all_tasks_multiple_sorted(readonly_service_with_data):
     """Test getting all tasks returns them sorted by ID."""
-    tasks = task_service_with_data.get_all_tasks()
+    tasks = readonly_service_with_data.get_all_tasks()
     assert len(tasks) == 3
-    assert tasks[0]["id"] == 1
-    assert tasks[1]["id"] == 2
-    assert tasks[2]["id"] == 3
+    assert [task.id for task in tasks] == [1, 2, 3]
 
 
-def test_get_task_by_id_found(task_service_with_data):
+def test_get_task_by_id_found(readonly_service_with_data):
     """Test retrieving an existing task by ID."""
-    task = task_service_with_data.get_task_by_id(2)
-    assert task["id"] == 2
-    assert task["title"] == "Task 2"
+    task = readonly_service_with_data.get_task_by_id(2)
+    assert task.id == 2
+    assert task.title == "Task 2"
 
 
 def test_get_task_by_id_not_found_raises_error(task_service):
@@ -86,27 +87,22 @@ def test_get_task_by_id_not_found_raises_error(task_service):
 
 
 # Update Task Tests
-def test_update_task_title_only(task_service_with_data):
-    """Test updating only the title."""
-    updated = task_service_with_data.update_task(1, title="New Title")
-    assert updated["title"] == "New Title"
-    assert updated["description"] == "Description 1"  # Unchanged
-
-
-def test_update_task_description_only(task_service_with_data):
-    """Test updating only the description."""
-    updated = task_service_with_data.update_task(1, description="New Desc")
-    assert updated["description"] == "New Desc"
-    assert updated["title"] == "Task 1"  # Unchanged
-
-
-def test_update_task_both_fields(task_service_with_data):
-    """Test updating both title and description."""
-    updated = task_service_with_data.update_task(
-        1, title="New Title", description="New Desc"
-    )
-    assert updated["title"] == "New Title"
-    assert updated["description"] == "New Desc"
+@pytest.mark.parametrize(
+    "changes, expected_title, expected_description",
+    [
+        ({"title": "New Title"}, "New Title", "Description 1"),
+        ({"description": "New Desc"}, "Task 1", "New Desc"),
+        ({"title": "New Title", "description": "New Desc"}, "New Title", "New Desc"),
+    ],
+    ids=["title_only", "description_only", "both_fields"],
+)
+def test_update_task_fields(
+    task_service_with_data, changes, expected_title, expected_description
+):
+    """Test updating title and/or description leaves other fields unchanged."""
+    updated = task_service_with_data.update_task(1, **changes)
+    assert updated.title == expected_title
+    assert updated.description == expected_description
 
 
 def test_update_task_preserves_other_fields(task_service_with_data):
@@ -114,9 +110,9 @@ def test_update_task_preserves_other_fields(task_service_with_data):
     original = task_service_with_data.get_task_by_id(1)
     updated = task_service_with_data.update_task(1, title="New Title")
 
-    assert updated["id"] == original["id"]
-    assert updated["completed"] == original["completed"]
-    assert updated["created_at"] == original["created_at"]
+    assert updated.id == original.id
+    assert updated.completed == original.completed
+    assert updated.created_at == original.created_at
 
 
 def test_update_task_not_found_raises_error(task_service):
@@ -142,8 +138,8 @@ def test_update_task_no_fields_raises_error(task_service_with_data):
 def test_delete_task_existing(task_service_with_data):
     """Test deleting an existing task."""
     deleted = task_service_with_data.delete_task(2)
-    assert deleted["id"] == 2
-    assert deleted["title"] == "Task 2"
+    assert deleted.id == 2
+    assert deleted.title == "Task 2"
 
     # Verify it's deleted
     with pytest.raises(TaskNotFoundError):
@@ -157,59 +153,77 @@ def test_delete_task_not_found_raises_error(task_service):
 
 
 # Complete/Uncomplete Tests
-def test_complete_task(task_service_with_data):
-    """Test marking a task as complete."""
-    task = task_service_with_data.complete_task(1)
-    assert task["completed"] is True
-
-
-def test_complete_task_already_complete_idempotent(task_service_with_data):
-    """Test that completing an already-complete task is idempotent."""
-    # Task 2 is already complete
-    task = task_service_with_data.complete_task(2)
-    assert task["completed"] is True  # Should still be True
-
-
-def test_uncomplete_task(task_service_with_data):
-    """Test marking a task as incomplete."""
-    # Task 2 is complete, mark it incomplete
-    task = task_service_with_data.uncomplete_task(2)
-    assert task["completed"] is False
-
-
-def test_uncomplete_task_already_incomplete_idempotent(task_service_with_data):
-    """Test that marking an incomplete task as incomplete is idempotent."""
-    # Task 1 is already incomplete
-    task = task_service_with_data.uncomplete_task(1)
-    assert task["completed"] is False  # Should still be False
+@pytest.mark.parametrize(
+    "operation, task_id, expected_completed",
+    [
+        ("complete_task", 1, True),
+        ("complete_task", 2, True),  # Task 2 is already complete
+        ("uncomplete_task", 2, False),
+        ("uncomplete_task", 1, False),  # Task 1 is already incomplete
+    ],
+    ids=["complete", "complete_idempotent", "uncomplete", "uncomplete_idempotent"],
+)
+def test_complete_uncomplete_task(
+    task_service_with_data, operation, task_id, expected_completed
+):
+    """Test marking tasks complete/incomplete, including idempotent repeats."""
+    task = getattr(task_service_with_data, operation)(task_id)
+    assert task.completed is expected_completed
+
+
+def test_completed_count_follows_status_changes(task_service_with_data):
+    """Test that the completed count tracks complete/uncomplete/delete."""
+    service = task_service_with_data
+    assert service.get_completed_count() == 1
+
+    service.complete_task(1)
+    service.complete_task(1)  # Idempotent, count unchanged
+    assert service.get_completed_count() == 2
+
+    service.uncomplete_task(2)
+    assert service.get_completed_count() == 1
+
+    service.delete_task(1)
+    assert service.get_completed_count() == 0
 
 
 # Timestamp Tests
 def test_timestamps_set_on_create(task_service):
     """Test that timestamps are set when creating a task."""
     task = task_service.add_task("Test")
-    assert "created_at" in task
-    assert "updated_at" in task
-    assert task["created_at"] == task["updated_at"]  # Same initially
+    assert task.created_at
+    assert task.updated_at
+    assert task.created_at == task.updated_at  # Same initially
 
 
-def test_updated_at_changes_on_update(task_service):
-    """Test that updated_at changes when task is updated."""
+def test_display_timestamps_set_on_create(task_service):
+    """Test that display timestamps are derived from the ISO timestamps."""
     task = task_service.add_task("Test")
-    original_updated = task["updated_at"]
+    assert task.created_display == task.created_at[:16].replace("T", " ")
+    assert task.updated_display == task.created_display
 
-    time.sleep(0.01)  # Small delay to ensure different timestamp
+
+def test_updated_at_changes_on_update(task_service, fake_clock):
+    """Test that updated_at changes when task is updated."""
+    task = task_service.add_task("Test")
+    original_updated = task.updated_at
 
     updated = task_service.update_task(1, title="Updated")
-    assert updated["updated_at"] != original_updated
+    assert updated.updated_at != original_updated
 
 
-def test_created_at_immutable_on_update(task_service):
+def test_created_at_immutable_on_update(task_service, fake_clock):
     """Test that created_at doesn't change when task is updated."""
     task = task_service.add_task("Test")
-    original_created = task["created_at"]
-
-    time.sleep(0.01)
+    original_created = task.created_at
 
     updated = task_service.update_task(1, title="Updated")
-    assert updated["created_at"] == original_created
+    assert updated.created_at == original_created
+
+
+def test_injected_clock_sets_timestamps():
+    """Test that a clock passed to TaskService drives task timestamps."""
+    service = TaskService(TaskRepository(), clock=lambda: datetime(2025, 6, 1, 9, 30))
+    task = service.add_task("Test")
+    assert task.created_at == "2025-06-01T09:30:00"
+    assert task.created_display == "2025-06-01 09:30"
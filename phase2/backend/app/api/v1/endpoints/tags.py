@@ -3,22 +3,23 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_session
+from app.responses import ORJSONResponse
 from app.services.task_service import TagService
-from app.schemas.task import TagSchema, TagCreate
+from app.schemas.task import TagListResponse, TagCreate, tag_to_dict
 from app.schemas.common import SuccessResponse
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
-@router.get("", response_model=SuccessResponse)
+@router.get("", response_model=TagListResponse)
 async def list_tags(
     session: AsyncSession = Depends(get_session)
 ):
     """List all tags for the current user."""
     tags = await TagService.list_tags(session)
-    tag_responses = [TagSchema.model_validate(tag) for tag in tags]
 
-    return SuccessResponse(data=[t.model_dump() for t in tag_responses])
+    # Rows are trusted, so bypass response_model validation
+    return ORJSONResponse({"data": [tag_to_dict(tag) for tag in tags], "message": None})
 
 
 @router.post("", response_model=SuccessResponse, status_code=201)
@@ -33,8 +34,7 @@ async def create_tag(
         color=tag_data.color
     )
 
-    tag_response = TagSchema.model_validate(tag)
-    return SuccessResponse(
-        data=tag_response.model_dump(),
+    return SuccessResponse.model_construct(
+        data=tag_to_dict(tag),
         message="Tag created successfully"
     )
@@ -4,8 +4,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 
 from app.database import get_session
+from app.responses import ORJSONResponse
 from app.services.task_service import TaskService
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskListResponse, TaskStatus, TaskSort, task_to_dict
+)
 from app.schemas.common import SuccessResponse
 from app.models.task import PriorityEnum
 
@@ -27,22 +30,23 @@ async def create_task(
     - **tags**: Array of tag names (creates new tags if needed)
     """
     task = await TaskService.create_task(session, task_data)
-    task_response = TaskResponse.model_validate(task)
 
-    return SuccessResponse(
-        data=task_response.model_dump(),
-        message="Task created successfully"
+    # Rendered by orjson like the list endpoint, so timestamps match
+    return ORJSONResponse(
+        {"data": task_to_dict(task), "message": "Task created successfully"},
+        status_code=201
     )
 
 
-@router.get("", response_model=SuccessResponse)
+@router.get("", response_model=TaskListResponse)
 async def list_tasks(
-    status: str = Query("all", regex="^(all|active|completed)$"),
+    status: TaskStatus = TaskStatus.ALL,
     priority: Optional[PriorityEnum] = None,
     tag: Optional[List[str]] = Query(None),
-    sort: str = Query("created_desc", regex="^(created_desc|created_asc|priority_desc|due_asc|title_asc)$"),
+    sort: TaskSort = TaskSort.CREATED_DESC,
     limit: int = Query(100, le=1000, ge=1),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_session)
 ):
     """
@@ -59,27 +63,48 @@ async def list_tasks(
     Pagination:
     - **limit**: Max results (default 100, max 1000)
     - **offset**: Skip N results
+    - **cursor**: Continue from a previous page's next_cursor (created_desc,
+      created_asc and title_asc sorts); faster than offset on deep pages.
+      Cursor pages return a null total; take it from the first page
     """
-    tasks, total = await TaskService.list_tasks(
-        session,
-        status=status,
-        priority=priority,
-        tags=tag,
-        sort_by=sort,
-        limit=limit,
-        offset=offset
-    )
+    try:
+        tasks, total = await TaskService.list_tasks(
+            session,
+            status=status,
+            priority=priority,
+            tags=tag,
+            sort_by=sort,
+            limit=limit,
+            offset=offset,
+            cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": str(exc)
+                }
+            }
+        )
 
-    task_responses = [TaskResponse.model_validate(task) for task in tasks]
+    next_cursor = None
+    if len(tasks) == limit:
+        next_cursor = TaskService.encode_cursor(tasks[-1], sort)
 
-    return SuccessResponse(
-        data={
-            "tasks": [t.model_dump() for t in task_responses],
+    # Rows are trusted, so bypass response_model validation; it still
+    # documents the response shape in OpenAPI
+    return ORJSONResponse({
+        "data": {
+            "tasks": [task_to_dict(task) for task in tasks],
             "total": total,
             "limit": limit,
-            "offset": offset
-        }
-    )
+            "offset": offset,
+            "next_cursor": next_cursor
+        },
+        "message": None
+    })
 
 
 @router.get("/{task_id}", response_model=SuccessResponse)
@@ -101,8 +126,7 @@ async def get_task(
             }
         )
 
-    task_response = TaskResponse.model_validate(task)
-    return SuccessResponse(data=task_response.model_dump())
+    return ORJSONResponse({"data": task_to_dict(task), "message": None})
 
 
 @router.patch("/{task_id}", response_model=SuccessResponse)
@@ -114,20 +138,8 @@ async def update_task(
     """
     Update a task (partial update).
 
-    All fields are optional. Only provided fields will be updated.
+    All fields are optional, but at least one must be provided.
     """
-    # Validate at least one field provided
-    if not any(task_data.model_dump(exclude_unset=True).values()):
-        raise HTTPException(
-            status_code=422,
-            detail={
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": "At least one field must be provided"
-                }
-            }
-        )
-
     task = await TaskService.update_task(session, task_id, task_data)
 
     if not task:
@@ -141,11 +153,7 @@ async def update_task(
             }
         )
 
-    task_response = TaskResponse.model_validate(task)
-    return SuccessResponse(
-        data=task_response.model_dump(),
-        message="Task updated successfully"
-    )
+    return ORJSONResponse({"data": task_to_dict(task), "message": "Task updated successfully"})
 
 
 @router.delete("/{task_id}", response_model=SuccessResponse)
@@ -167,7 +175,7 @@ async def delete_task(
             }
         )
 
-    return SuccessResponse(
+    return SuccessResponse.model_construct(
         data=None,
         message="Task deleted successfully"
     )
@@ -1,4 +1,5 @@
 """Application configuration using Pydantic settings."""
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -8,6 +9,9 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    NETWORK_FS: bool = False  # SQLite file on a network filesystem (no WAL)
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -23,4 +27,7 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, reading the environment once."""
+    return Settings()
@@ -1,17 +1,32 @@
 """FastAPI application entry point."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.config import settings
+from app.responses import ORJSONResponse
+from app.config import get_settings
 from app.database import init_db
 from app.api.v1.endpoints import tasks, tags
 
 
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create tables on startup in debug mode; otherwise rely on migrations."""
+    if settings.DEBUG:
+        await init_db()
+    yield
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Evolution of Todo - Phase II API",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -28,12 +43,6 @@ app.include_router(tasks.router, prefix="/api/v1")
 app.include_router(tags.router, prefix="/api/v1")
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup."""
-    await init_db()
-
-
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
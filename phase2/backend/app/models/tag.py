@@ -1,4 +1,5 @@
 """Tag model for database."""
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import Optional, TYPE_CHECKING, List
 from .task_tag import TaskTag
@@ -12,13 +13,18 @@ class Tag(SQLModel, table=True):
     """Tag model for categorizing tasks."""
 
     __tablename__ = "tags"
+    # One tag per name per user; also the conflict target for tag upserts,
+    # and covers lookups by user_id alone
+    __table_args__ = (
+        Index("uq_tags_user_name", "user_id", "name", unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=50, index=True)
     color: Optional[str] = Field(default=None, max_length=7)  # Hex color code
 
     # Foreign key
-    user_id: int = Field(foreign_key="users.id", default=1, index=True)
+    user_id: int = Field(foreign_key="users.id", default=1)
 
     # Relationships
     user: Optional["User"] = Relationship(back_populates="tags")
@@ -1,4 +1,5 @@
 """Task model for database."""
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING, List
@@ -22,6 +23,12 @@ class Task(SQLModel, table=True):
     """Task model with all Phase II fields."""
 
     __tablename__ = "tasks"
+    # Composite indexes matching the list_tasks filter + sort combinations
+    __table_args__ = (
+        Index("ix_tasks_user_completed_created", "user_id", "completed", "created_at"),
+        Index("ix_tasks_user_priority_created", "user_id", "priority", "created_at"),
+        Index("ix_tasks_user_due", "user_id", "due_date"),
+    )
 
     # Primary key
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -29,10 +36,10 @@ class Task(SQLModel, table=True):
     # Core fields
     title: str = Field(max_length=200, index=True)
     description: str = Field(default="", max_length=1000)
-    completed: bool = Field(default=False, index=True)
+    completed: bool = Field(default=False)
 
     # New Phase II fields
-    priority: str = Field(default=PriorityEnum.MEDIUM.value, index=True)
+    priority: str = Field(default=PriorityEnum.MEDIUM.value)
     due_date: Optional[datetime] = Field(default=None, nullable=True, index=True)
 
     # Timestamps
@@ -44,4 +51,9 @@ class Task(SQLModel, table=True):
 
     # Relationships
     user: Optional["User"] = Relationship(back_populates="tasks")
-    tags: List["Tag"] = Relationship(back_populates="tasks", link_model=TaskTag)
+    # Batch-load tags by default so callers without selectinload avoid N+1
+    tags: List["Tag"] = Relationship(
+        back_populates="tasks",
+        link_model=TaskTag,
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
@@ -0,0 +1,17 @@
+"""Response classes shared by the API."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, which encodes datetimes natively.
+
+    Naive datetimes are stored as UTC, so they are rendered with a +00:00
+    offset (OPT_NAIVE_UTC).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC)
@@ -1,14 +1,26 @@
 """Pydantic schemas package."""
 from .common import SuccessResponse, ErrorResponse
-from .task import TaskBase, TaskCreate, TaskUpdate, TaskResponse, TagSchema, TagCreate
+from .task import (
+    Priority, TaskStatus, TaskSort, TaskBase, TaskCreate, TaskUpdate, TaskResponse,
+    TaskListData, TaskListResponse, TagSchema, TagListResponse, TagCreate,
+    tag_to_dict, task_to_dict
+)
 
 __all__ = [
     "SuccessResponse",
     "ErrorResponse", 
+    "Priority",
+    "TaskStatus",
+    "TaskSort",
     "TaskBase",
     "TaskCreate",
     "TaskUpdate",
     "TaskResponse",
+    "TaskListData",
+    "TaskListResponse",
     "TagSchema",
-    "TagCreate"
+    "TagListResponse",
+    "TagCreate",
+    "tag_to_dict",
+    "task_to_dict"
 ]
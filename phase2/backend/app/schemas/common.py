@@ -4,7 +4,12 @@ from typing import Any, Optional
 
 
 class SuccessResponse(BaseModel):
-    """Standard success response wrapper."""
+    """
+    Standard success response wrapper.
+
+    Endpoints build it with model_construct(), which skips validation;
+    only do that with payloads the endpoint has just produced itself.
+    """
 
     data: Any
     message: Optional[str] = None
@@ -1,8 +1,36 @@
 """Pydantic schemas for task validation and serialization."""
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime
-from typing import Optional, List
-from app.models.task import PriorityEnum
+from enum import Enum
+from typing import Optional, List, Dict, Any, Literal, TYPE_CHECKING
+from app.schemas.common import SuccessResponse
+
+if TYPE_CHECKING:
+    from app.models.tag import Tag
+    from app.models.task import Task
+
+
+# Priority values as a Literal: validated by plain set membership instead
+# of enum coercion. Mirrors PriorityEnum, which the model layer keeps.
+Priority = Literal["high", "medium", "low"]
+
+
+class TaskStatus(str, Enum):
+    """Status filter values for listing tasks."""
+
+    ALL = "all"
+    ACTIVE = "active"
+    COMPLETED = "completed"
+
+
+class TaskSort(str, Enum):
+    """Sort orders for listing tasks."""
+
+    CREATED_DESC = "created_desc"
+    CREATED_ASC = "created_asc"
+    PRIORITY_DESC = "priority_desc"
+    DUE_ASC = "due_asc"
+    TITLE_ASC = "title_asc"
 
 
 class TagSchema(BaseModel):
@@ -20,7 +48,7 @@ class TaskBase(BaseModel):
 
     title: str = Field(..., min_length=1, max_length=200)
     description: str = Field(default="", max_length=1000)
-    priority: PriorityEnum = PriorityEnum.MEDIUM
+    priority: Priority = "medium"
     due_date: Optional[datetime] = None
 
     @field_validator('title')
@@ -37,13 +65,19 @@ class TaskCreate(TaskBase):
 
     tags: List[str] = Field(default_factory=list)
 
+    @field_validator('tags')
+    @classmethod
+    def normalize_tags(cls, v: List[str]) -> List[str]:
+        """Normalize tag names to lowercase, the form tags are stored in."""
+        return [t.strip().lower() for t in v]
+
 
 class TaskUpdate(BaseModel):
     """Schema for updating an existing task (all fields optional)."""
 
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
-    priority: Optional[PriorityEnum] = None
+    priority: Optional[Priority] = None
     completed: Optional[bool] = None
     due_date: Optional[datetime] = None
     tags: Optional[List[str]] = None
@@ -56,6 +90,26 @@ class TaskUpdate(BaseModel):
             raise ValueError('Title cannot be empty')
         return v.strip() if v else None
 
+    @field_validator('tags')
+    @classmethod
+    def normalize_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Normalize tag names to lowercase if provided."""
+        return [t.strip().lower() for t in v] if v is not None else None
+
+    @model_validator(mode='after')
+    def at_least_one_field(self) -> "TaskUpdate":
+        """Validate that the update changes at least one field."""
+        if (
+            self.title is None
+            and self.description is None
+            and self.priority is None
+            and self.completed is None
+            and self.due_date is None
+            and self.tags is None
+        ):
+            raise ValueError('At least one field must be provided')
+        return self
+
 
 class TaskResponse(TaskBase):
     """Schema for task in responses."""
@@ -70,6 +124,55 @@ class TaskResponse(TaskBase):
     model_config = {"from_attributes": True}
 
 
+def tag_to_dict(tag: "Tag") -> Dict[str, Any]:
+    """Serialize a Tag row to the TagSchema shape without validation."""
+    return {"id": tag.id, "name": tag.name, "color": tag.color}
+
+
+def task_to_dict(task: "Task") -> Dict[str, Any]:
+    """
+    Serialize a Task row to the TaskResponse shape without validation.
+
+    Used on the response path, where rows come straight from the database
+    and re-validating them through TaskResponse would only cost time.
+    Keep the keys in sync with TaskResponse, which still documents them.
+    """
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "priority": task.priority,
+        "due_date": task.due_date,
+        "completed": task.completed,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+        "user_id": task.user_id,
+        "tags": [tag_to_dict(tag) for tag in task.tags],
+    }
+
+
+class TaskListData(BaseModel):
+    """Paginated task list payload."""
+
+    tasks: List[TaskResponse]
+    total: Optional[int]  # None on cursor pages, which skip the count
+    limit: int
+    offset: int
+    next_cursor: Optional[str] = None
+
+
+class TaskListResponse(SuccessResponse):
+    """Success response wrapping a paginated task list."""
+
+    data: TaskListData
+
+
+class TagListResponse(SuccessResponse):
+    """Success response wrapping a list of tags."""
+
+    data: List[TagSchema]
+
+
 class TagCreate(BaseModel):
     """Schema for creating a new tag."""
 
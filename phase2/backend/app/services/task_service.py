@@ -1,13 +1,118 @@
 """Task service with business logic for CRUD operations."""
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from sqlalchemy.orm import selectinload
-from typing import Optional, List, Tuple
+from sqlalchemy import select, insert, delete, and_, or_, func, case, tuple_, literal, bindparam, lambda_stmt
+from sqlalchemy.orm import selectinload, raiseload
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import col
+from typing import Optional, List, Tuple, Dict, Set, cast
+from collections import OrderedDict
 from datetime import datetime
+import base64
+import json
+import random
+import time
 
 from app.models.task import Task, TaskTag, PriorityEnum
 from app.models.tag import Tag
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import TaskCreate, TaskUpdate, TaskSort
+
+
+# Palette new tags pick a random color from
+_TAG_COLORS = ("#3B82F6", "#EF4444", "#F59E0B", "#10B981", "#8B5CF6", "#EC4899")
+
+# Sorts that support keyset (cursor) pagination:
+# sort -> (sort column attribute name, descending)
+_KEYSET_SORTS = {
+    TaskSort.CREATED_DESC: ("created_at", True),
+    TaskSort.CREATED_ASC: ("created_at", False),
+    TaskSort.TITLE_ASC: ("title", False),
+}
+
+# Priority rank for sorting (high first); the stored strings sort lexically
+_PRIORITY_ORDER = case(
+    (col(Task.priority) == PriorityEnum.HIGH.value, 0),
+    (col(Task.priority) == PriorityEnum.MEDIUM.value, 1),
+    (col(Task.priority) == PriorityEnum.LOW.value, 2),
+)
+
+# Hot single-row lookups, built once; lambda_stmt caches their compiled
+# SQL by code location instead of re-deriving cache keys per call
+_GET_TASK_STMT = lambda_stmt(
+    lambda: select(Task)
+    .options(selectinload(Task.tags))
+    .where(Task.id == bindparam("task_id"), Task.user_id == bindparam("user_id"))
+)
+# Task columns only: touching any relationship raises instead of lazy loading
+_GET_TASK_ROW_STMT = lambda_stmt(
+    lambda: select(Task)
+    .options(raiseload("*"))
+    .where(Task.id == bindparam("task_id"), Task.user_id == bindparam("user_id"))
+)
+_FIND_TASK_STMT = lambda_stmt(
+    lambda: select(Task)
+    .where(Task.id == bindparam("task_id"), Task.user_id == bindparam("user_id"))
+)
+_FIND_TAG_STMT = lambda_stmt(
+    lambda: select(Tag)
+    .where(Tag.name == bindparam("tag_name"), Tag.user_id == bindparam("user_id"))
+)
+
+# Per-user list_tags results: user_id -> (expires_at, detached tag copies),
+# least recently used first. The cache lives in each worker process and
+# invalidate_cache only clears the local one, so another worker can serve a
+# user's tag list without a tag they just created for up to the TTL.
+TAG_CACHE_TTL_SECONDS = 30.0
+TAG_CACHE_MAXSIZE = 1024
+_tag_cache: OrderedDict[int, Tuple[float, List[Tag]]] = OrderedDict()
+
+# INSERT constructs supporting ON CONFLICT, by dialect name
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+async def _insert_tags(
+    session: AsyncSession,
+    names: Set[str],
+    user_id: int,
+    color: Optional[str] = None
+) -> List[Tag]:
+    """
+    Insert the named tags in one statement, skipping any that exist.
+
+    Conflicts on (user_id, name) are ignored, so a tag created
+    concurrently since the caller looked it up is fetched instead of
+    failing the transaction. Tags without a color get a random one.
+    Dialects without ON CONFLICT support get a plain ORM insert, which
+    relies on the caller having looked the names up first.
+    """
+    upsert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if upsert is None:
+        tags = [
+            Tag(name=name, color=color or random.choice(_TAG_COLORS), user_id=user_id)
+            for name in names
+        ]
+        session.add_all(tags)
+        await session.flush()  # Get tag IDs
+        return tags
+
+    result = await session.scalars(
+        upsert(Tag)
+        .values([
+            {"name": name, "color": color or random.choice(_TAG_COLORS), "user_id": user_id}
+            for name in names
+        ])
+        .on_conflict_do_nothing(index_elements=["user_id", "name"])
+        .returning(Tag)
+    )
+    tags = list(result)
+
+    skipped = names - {tag.name for tag in tags}
+    if skipped:
+        result = await session.scalars(
+            select(Tag).where(Tag.name.in_(skipped), Tag.user_id == user_id)
+        )
+        tags.extend(result)
+
+    return tags
 
 
 class TaskService:
@@ -20,7 +125,7 @@ class TaskService:
         task = Task(
             title=task_data.title,
             description=task_data.description,
-            priority=task_data.priority.value,
+            priority=task_data.priority,
             due_date=task_data.due_date,
             user_id=user_id
         )
@@ -30,39 +135,60 @@ class TaskService:
 
         # Handle tags
         if task_data.tags:
-            for tag_name in task_data.tags:
-                # Find or create tag
-                result = await session.execute(
-                    select(Tag).where(
-                        and_(
-                            func.lower(Tag.name) == tag_name.lower(),
-                            Tag.user_id == user_id
-                        )
-                    )
-                )
-                tag = result.scalar_one_or_none()
+            tags = await TaskService._get_or_create_tags(session, task_data.tags, user_id)
+            await TaskService._link_tags(session, task.id, tags)
 
-                if not tag:
-                    # Generate a random color for new tags
-                    colors = ["#3B82F6", "#EF4444", "#F59E0B", "#10B981", "#8B5CF6", "#EC4899"]
-                    import random
-                    tag = Tag(name=tag_name.lower(), color=random.choice(colors), user_id=user_id)
-                    session.add(tag)
-                    await session.flush()
+        await session.commit()
 
-                # Link tag to task
-                task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
-                session.add(task_tag)
+        if task_data.tags:
+            TagService.invalidate_cache(user_id)
 
-        await session.commit()
+        # Load the tag collection only; the task row is already current
+        await session.refresh(task, attribute_names=["tags"])
+        return task
 
-        # Reload task with relationships
-        result = await session.execute(
-            select(Task)
-            .options(selectinload(Task.tags))
-            .where(Task.id == task.id)
+    @staticmethod
+    async def _get_or_create_tags(
+        session: AsyncSession,
+        tag_names: List[str],
+        user_id: int
+    ) -> List[Tag]:
+        """
+        Fetch the named tags in one query, creating any that are missing.
+
+        Names must already be lowercase (TaskCreate/TaskUpdate normalize
+        them), matching how tags are stored, so the lookup can use the
+        tag name index.
+        """
+        names = set(tag_names)
+        if not names:
+            return []
+
+        result = await session.scalars(
+            select(Tag).where(
+                and_(
+                    Tag.name.in_(names),
+                    Tag.user_id == user_id
+                )
+            )
         )
-        return result.scalar_one()
+        tags = list(result)
+
+        missing = names - {tag.name for tag in tags}
+        if missing:
+            tags.extend(await _insert_tags(session, missing, user_id))
+
+        return tags
+
+    @staticmethod
+    async def _link_tags(session: AsyncSession, task_id: int, tags: List[Tag]) -> None:
+        """Insert the task's TaskTag rows in one multi-row INSERT."""
+        if tags:
+            # Tags come flushed or selected, so every primary key is set
+            links: List[Dict[str, int]] = [
+                {"task_id": task_id, "tag_id": cast(int, tag.id)} for tag in tags
+            ]
+            await session.execute(insert(TaskTag), links)
 
     @staticmethod
     async def list_tasks(
@@ -73,69 +199,156 @@ class TaskService:
         tags: Optional[List[str]] = None,
         sort_by: str = "created_desc",
         limit: int = 100,
-        offset: int = 0
-    ) -> Tuple[List[Task], int]:
-        """List tasks with filtering and sorting."""
-        # Build query
-        query = select(Task).options(selectinload(Task.tags)).where(Task.user_id == user_id)
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Task], Optional[int]]:
+        """
+        List tasks with filtering and sorting.
+
+        A cursor from encode_cursor continues after the task it was made
+        from, seeking through the sort index instead of skipping rows the
+        way offset does. Only sorts in _KEYSET_SORTS accept one; raises
+        ValueError for an invalid or mismatched cursor. Cursor pages skip
+        counting and return None for the total; the first page has it.
+        """
+        # Filters are lambda_stmt steps: SQLAlchemy caches the compiled SQL
+        # for each combination of branches taken, and the closure values
+        # below become bound parameters instead of new SQL per call
+        filters = [lambda s: s.where(Task.user_id == user_id)]
 
         # Filter by status
         if status == "active":
-            query = query.where(Task.completed == False)
+            filters.append(lambda s: s.where(Task.completed == False))
         elif status == "completed":
-            query = query.where(Task.completed == True)
+            filters.append(lambda s: s.where(Task.completed == True))
 
         # Filter by priority
         if priority:
-            query = query.where(Task.priority == priority.value)
+            priority_value = priority.value
+            filters.append(lambda s: s.where(Task.priority == priority_value))
 
         # Filter by tags
         if tags:
-            # Tasks that have ANY of the specified tags
-            query = query.join(TaskTag).join(Tag).where(
-                func.lower(Tag.name).in_([t.lower() for t in tags])
-            ).distinct()
+            # Tasks that have ANY of the specified tags. A subquery keeps one
+            # row per task, so the windowed count below needs no DISTINCT.
+            tag_names = [t.lower() for t in tags]
+            filters.append(lambda s: s.where(col(Task.id).in_(
+                select(col(TaskTag.task_id)).join(Tag).where(
+                    col(Tag.name).in_(tag_names)
+                )
+            )))
+
+        # Select the page and the total match count in one round-trip
+        query = lambda_stmt(
+            lambda: select(Task, func.count().over().label("total"))
+            .options(selectinload(Task.tags))
+        )
+        for step in filters:
+            query += step
 
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await session.execute(count_query)
-        total = total_result.scalar()
+        # Continue after the cursor's (sort value, id)
+        if cursor is not None:
+            keyset = TaskService._keyset_condition(sort_by, cursor)
+            query += lambda s: s.where(keyset)
 
-        # Apply sorting
+        # Apply sorting (id breaks ties so keyset pages never overlap)
         if sort_by == "created_asc":
-            query = query.order_by(Task.created_at.asc())
+            query += lambda s: s.order_by(col(Task.created_at).asc(), col(Task.id).asc())
         elif sort_by == "priority_desc":
-            # High > Medium > Low
-            priority_order = {"high": 0, "medium": 1, "low": 2}
-            query = query.order_by(
-                Task.priority.desc()  # This will work with the string values
+            # High > Medium > Low, newest first within a priority
+            query += lambda s: s.order_by(
+                _PRIORITY_ORDER.asc(), col(Task.created_at).desc(), col(Task.id).desc()
             )
         elif sort_by == "due_asc":
             # Null values last
-            query = query.order_by(Task.due_date.asc().nullslast())
+            query += lambda s: s.order_by(col(Task.due_date).asc().nullslast())
         elif sort_by == "title_asc":
-            query = query.order_by(Task.title.asc())
+            query += lambda s: s.order_by(col(Task.title).asc(), col(Task.id).asc())
         else:  # created_desc (default)
-            query = query.order_by(Task.created_at.desc())
+            query += lambda s: s.order_by(col(Task.created_at).desc(), col(Task.id).desc())
 
         # Apply pagination
-        query = query.limit(limit).offset(offset)
+        query += lambda s: s.limit(limit).offset(offset)
 
         # Execute query
         result = await session.execute(query)
-        tasks = result.scalars().unique().all()
+        rows = result.all()
+
+        if cursor is not None:
+            # The window would only count the remaining rows, and a full
+            # count on every page would undo the point of keyset paging
+            total = None
+        elif rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end has no rows to carry the window count
+            count_query = lambda_stmt(lambda: select(func.count()).select_from(Task))
+            for step in filters:
+                count_query += step
+            total = await session.scalar(count_query)
+        else:
+            total = 0
+
+        return [row.Task for row in rows], total
 
-        return list(tasks), total
+    @staticmethod
+    def encode_cursor(task: Task, sort_by: str) -> Optional[str]:
+        """Build a cursor for the page after task, or None if sort_by has no keyset."""
+        keyset = _KEYSET_SORTS.get(TaskSort(sort_by))
+        if keyset is None:
+            return None
+
+        value = getattr(task, keyset[0])
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps([TaskSort(sort_by).value, value, task.id])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
 
     @staticmethod
-    async def get_task_by_id(session: AsyncSession, task_id: int, user_id: int = 1) -> Optional[Task]:
-        """Get a specific task by ID."""
-        result = await session.execute(
-            select(Task)
-            .options(selectinload(Task.tags))
-            .where(and_(Task.id == task_id, Task.user_id == user_id))
+    def _keyset_condition(sort_by: str, cursor: str):
+        """Decode cursor into a WHERE clause selecting rows after it."""
+        keyset = _KEYSET_SORTS.get(TaskSort(sort_by))
+        if keyset is None:
+            raise ValueError(f"Sort '{TaskSort(sort_by).value}' does not support cursors")
+
+        try:
+            cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(cursor))
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+        if cursor_sort != TaskSort(sort_by).value:
+            raise ValueError("Cursor does not match the requested sort")
+
+        # Both keyset columns travel as strings (created_at in ISO format);
+        # anything else would reach the driver as a bad bind value
+        if not isinstance(value, str) or type(last_id) is not int:
+            raise ValueError("Invalid cursor")
+        if keyset[0] == "created_at":
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                raise ValueError("Invalid cursor")
+
+        row = tuple_(getattr(Task, keyset[0]), col(Task.id))
+        last = tuple_(literal(value), literal(last_id))
+        return row < last if keyset[1] else row > last
+
+    @staticmethod
+    async def get_task_by_id(
+        session: AsyncSession,
+        task_id: int,
+        user_id: int = 1,
+        include_tags: bool = True
+    ) -> Optional[Task]:
+        """
+        Get a specific task by ID.
+
+        With include_tags=False only the task row is loaded, and accessing
+        task.tags raises instead of querying.
+        """
+        return await session.scalar(
+            _GET_TASK_STMT if include_tags else _GET_TASK_ROW_STMT,
+            {"task_id": task_id, "user_id": user_id}
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def update_task(
@@ -145,11 +358,9 @@ class TaskService:
         user_id: int = 1
     ) -> Optional[Task]:
         """Update an existing task."""
-        # Get task
-        result = await session.execute(
-            select(Task).where(and_(Task.id == task_id, Task.user_id == user_id))
-        )
-        task = result.scalar_one_or_none()
+        # Get task; its current tags are only needed to diff a new tag list
+        stmt = _GET_TASK_STMT if task_data.tags is not None else _GET_TASK_ROW_STMT
+        task = await session.scalar(stmt, {"task_id": task_id, "user_id": user_id})
 
         if not task:
             return None
@@ -158,62 +369,47 @@ class TaskService:
         update_data = task_data.model_dump(exclude_unset=True, exclude={'tags'})
 
         for field, value in update_data.items():
-            if field == 'priority' and value:
-                setattr(task, field, value.value)
-            else:
-                setattr(task, field, value)
+            setattr(task, field, value)
 
+        # Stamped here rather than by the database: tag-only updates change
+        # no task column, and SQLite's now() would truncate to whole seconds
         task.updated_at = datetime.utcnow()
 
         # Handle tags update if provided
         if task_data.tags is not None:
-            # Remove existing tag associations
-            await session.execute(
-                select(TaskTag).where(TaskTag.task_id == task_id)
-            )
-            await session.execute(
-                TaskTag.__table__.delete().where(TaskTag.task_id == task_id)
-            )
-
-            # Add new tags
-            for tag_name in task_data.tags:
-                result = await session.execute(
-                    select(Tag).where(
-                        and_(
-                            func.lower(Tag.name) == tag_name.lower(),
-                            Tag.user_id == user_id
-                        )
+            current = {tag.name: tag for tag in task.tags}
+            new_names = set(task_data.tags)
+
+            # Only touch the associations that actually changed
+            removed_ids = [tag.id for name, tag in current.items() if name not in new_names]
+            if removed_ids:
+                await session.execute(
+                    delete(TaskTag).where(
+                        col(TaskTag.task_id) == task_id,
+                        col(TaskTag.tag_id).in_(removed_ids)
                     )
                 )
-                tag = result.scalar_one_or_none()
-
-                if not tag:
-                    import random
-                    colors = ["#3B82F6", "#EF4444", "#F59E0B", "#10B981", "#8B5CF6", "#EC4899"]
-                    tag = Tag(name=tag_name.lower(), color=random.choice(colors), user_id=user_id)
-                    session.add(tag)
-                    await session.flush()
 
-                task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
-                session.add(task_tag)
+            added_names = [name for name in new_names if name not in current]
+            if added_names:
+                tags = await TaskService._get_or_create_tags(session, added_names, user_id)
+                await TaskService._link_tags(session, task.id, tags)
 
         await session.commit()
 
-        # Reload with relationships
-        result = await session.execute(
-            select(Task)
-            .options(selectinload(Task.tags))
-            .where(Task.id == task_id)
-        )
-        return result.scalar_one()
+        if task_data.tags:
+            TagService.invalidate_cache(user_id)
+
+        # Load the tag collection only; the task row is already current
+        await session.refresh(task, attribute_names=["tags"])
+        return task
 
     @staticmethod
     async def delete_task(session: AsyncSession, task_id: int, user_id: int = 1) -> bool:
         """Delete a task."""
-        result = await session.execute(
-            select(Task).where(and_(Task.id == task_id, Task.user_id == user_id))
+        task = await session.scalar(
+            _FIND_TASK_STMT, {"task_id": task_id, "user_id": user_id}
         )
-        task = result.scalar_one_or_none()
 
         if not task:
             return False
@@ -228,37 +424,53 @@ class TagService:
 
     @staticmethod
     async def list_tags(session: AsyncSession, user_id: int = 1) -> List[Tag]:
-        """List all tags for a user."""
-        result = await session.execute(
-            select(Tag).where(Tag.user_id == user_id).order_by(Tag.name)
+        """
+        List all tags for a user.
+
+        Results are cached per user for TAG_CACHE_TTL_SECONDS, for at most
+        TAG_CACHE_MAXSIZE users, and returned as detached copies; code that
+        creates tags must call invalidate_cache afterwards.
+        """
+        now = time.monotonic()
+        cached = _tag_cache.get(user_id)
+        if cached is not None and cached[0] > now:
+            _tag_cache.move_to_end(user_id)
+            return list(cached[1])
+
+        result = await session.scalars(
+            select(Tag).where(col(Tag.user_id) == user_id).order_by(col(Tag.name))
         )
-        return list(result.scalars().all())
+        tags = [
+            Tag(id=tag.id, name=tag.name, color=tag.color, user_id=tag.user_id)
+            for tag in result
+        ]
+        _tag_cache[user_id] = (now + TAG_CACHE_TTL_SECONDS, tags)
+        _tag_cache.move_to_end(user_id)
+        while len(_tag_cache) > TAG_CACHE_MAXSIZE:
+            _tag_cache.popitem(last=False)
+        return list(tags)
+
+    @staticmethod
+    def invalidate_cache(user_id: Optional[int] = None) -> None:
+        """Drop cached list_tags results for one user, or for all users."""
+        if user_id is None:
+            _tag_cache.clear()
+        else:
+            _tag_cache.pop(user_id, None)
 
     @staticmethod
     async def create_tag(session: AsyncSession, name: str, color: Optional[str] = None, user_id: int = 1) -> Tag:
         """Create a new tag."""
         # Check if tag already exists
-        result = await session.execute(
-            select(Tag).where(
-                and_(
-                    func.lower(Tag.name) == name.lower(),
-                    Tag.user_id == user_id
-                )
-            )
+        existing_tag = await session.scalar(
+            _FIND_TAG_STMT, {"tag_name": name.lower(), "user_id": user_id}
         )
-        existing_tag = result.scalar_one_or_none()
 
         if existing_tag:
             return existing_tag
 
-        # Create new tag
-        if not color:
-            import random
-            colors = ["#3B82F6", "#EF4444", "#F59E0B", "#10B981", "#8B5CF6", "#EC4899"]
-            color = random.choice(colors)
-
-        tag = Tag(name=name.lower(), color=color, user_id=user_id)
-        session.add(tag)
+        # Create new tag (RETURNING loads it, so no refresh is needed)
+        [tag] = await _insert_tags(session, {name.lower()}, user_id, color)
         await session.commit()
-        await session.refresh(tag)
+        TagService.invalidate_cache(user_id)
         return tag
@@ -0,0 +1,65 @@
+"""Apply database migrations, adopting schemas created before Alembic."""
+import asyncio
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+from app.database import engine
+
+# Revision matching the schema the old startup init_db created
+BASELINE_REVISION = "45e1a6a6e4a2"
+
+# Index each revision introduced, newest first. init_db builds the schema from
+# the current models, so the newest marker present tells which revision an
+# untracked database already matches.
+REVISION_MARKERS = [
+    ("6e82e5db5d06", "tags", "uq_tags_user_name"),
+    ("3c255d3c2ea0", "tasks", "ix_tasks_user_due"),
+]
+
+
+def detect_revision(conn: Connection) -> Optional[str]:
+    """Return the revision an untracked schema matches, or None if there is nothing to stamp."""
+    inspector = inspect(conn)
+    tables = set(inspector.get_table_names())
+    if "tasks" not in tables or "alembic_version" in tables:
+        return None
+
+    for revision, table, index in REVISION_MARKERS:
+        if index in {ix["name"] for ix in inspector.get_indexes(table)}:
+            return revision
+    return BASELINE_REVISION
+
+
+async def untracked_revision() -> Optional[str]:
+    """Inspect the configured database for a schema Alembic has never touched."""
+    async with engine.connect() as conn:
+        revision = await conn.run_sync(detect_revision)
+    await engine.dispose()
+    return revision
+
+
+def main() -> None:
+    """Stamp init_db-created databases with the revision they match, then upgrade to head."""
+    backend_dir = Path(__file__).parent.parent
+    config = Config(str(backend_dir / "alembic.ini"))
+    config.set_main_option("script_location", str(backend_dir / "alembic"))
+
+    revision = asyncio.run(untracked_revision())
+    if revision is not None:
+        print(f"Existing schema without migration history; stamping {revision}")
+        command.stamp(config, revision)
+
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    main()
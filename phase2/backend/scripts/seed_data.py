@@ -6,6 +6,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 
@@ -44,20 +45,25 @@ async def seed_database():
             {"name": "shopping", "color": "#10B981"},
         ]
 
-        tags_created = []
-        for tag_data in tags_data:
-            result = await session.execute(
-                select(Tag).where(Tag.name == tag_data["name"], Tag.user_id == 1)
+        result = await session.execute(
+            select(Tag.name).where(
+                Tag.user_id == 1,
+                Tag.name.in_([tag_data["name"] for tag_data in tags_data])
             )
-            existing_tag = result.scalar_one_or_none()
+        )
+        existing_tag_names = set(result.scalars())
 
-            if not existing_tag:
-                tag = Tag(**tag_data, user_id=1)
-                session.add(tag)
+        tags_created = []
+        new_tags = []
+        for tag_data in tags_data:
+            if tag_data["name"] not in existing_tag_names:
+                new_tags.append(Tag(**tag_data, user_id=1))
                 tags_created.append(tag_data["name"])
             else:
                 print(f"✓ Tag '{tag_data['name']}' already exists")
 
+        session.add_all(new_tags)
+
         if tags_created:
             print(f"✓ Created tags: {', '.join(tags_created)}")
 
@@ -98,33 +104,47 @@ async def seed_database():
             },
         ]
 
+        result = await session.execute(
+            select(Task.title).where(
+                Task.user_id == 1,
+                Task.title.in_([task_data["title"] for task_data in tasks_data])
+            )
+        )
+        existing_titles = set(result.scalars())
+
+        needed_tag_names = {
+            tag_name for task_data in tasks_data for tag_name in task_data["tag_names"]
+        }
+        result = await session.execute(
+            select(Tag).where(Tag.user_id == 1, Tag.name.in_(needed_tag_names))
+        )
+        tag_map = {tag.name: tag for tag in result.scalars()}
+
         tasks_created = []
+        new_tasks = []
         for task_data in tasks_data:
             tag_names = task_data.pop("tag_names", [])
 
-            # Check if task already exists (by title)
-            result = await session.execute(
-                select(Task).where(Task.title == task_data["title"], Task.user_id == 1)
-            )
-            existing_task = result.scalar_one_or_none()
-
-            if not existing_task:
-                task = Task(**task_data)
-                session.add(task)
-                await session.flush()  # Get task ID
-
-                # Link tags
-                for tag_name in tag_names:
-                    result = await session.execute(
-                        select(Tag).where(Tag.name == tag_name, Tag.user_id == 1)
-                    )
-                    tag = result.scalar_one()
-                    task_tag = TaskTag(task_id=task.id, tag_id=tag.id)
-                    session.add(task_tag)
-
-                tasks_created.append(task_data["title"])
-            else:
+            # Skip tasks that already exist (by title)
+            if task_data["title"] in existing_titles:
                 print(f"✓ Task '{task_data['title']}' already exists")
+                continue
+
+            new_tasks.append((Task(**task_data), tag_names))
+            tasks_created.append(task_data["title"])
+
+        session.add_all([task for task, _ in new_tasks])
+        await session.flush()  # Get task IDs
+
+        task_tag_rows = [
+            {"task_id": task.id, "tag_id": tag_map[tag_name].id}
+            for task, tag_names in new_tasks
+            for tag_name in tag_names
+        ]
+
+        # Link tags in a single multi-row INSERT
+        if task_tag_rows:
+            await session.execute(insert(TaskTag), task_tag_rows)
 
         if tasks_created:
             print(f"✓ Created tasks: {', '.join(tasks_created)}")
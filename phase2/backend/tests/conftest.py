@@ -1,57 +1,109 @@
 """Pytest fixtures for testing."""
+import os
 import pytest
-import asyncio
-from typing import AsyncGenerator
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List
+from unittest.mock import AsyncMock
+from sqlalchemy import event, make_url, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from httpx import AsyncClient
+from sqlalchemy.pool import StaticPool
+from httpx import AsyncClient, ASGITransport
 
 from app.main import app
 from app.database import get_session
+from app.services.task_service import TagService
 from app.models import User, Tag, Task, TaskTag
 from sqlmodel import SQLModel
 
 
-# Use SQLite for testing
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# In-memory SQLite by default (one shared connection via StaticPool);
+# set TEST_DATABASE_URL to run the suite against e.g. PostgreSQL instead
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite+aiosqlite://")
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+async def _worker_database_url(url: str) -> str:
+    """
+    Give each pytest-xdist worker its own PostgreSQL database.
 
+    The database named in url gets a _gw<N> suffix and is created on
+    first use. In-memory SQLite is already private to each worker process.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker or url.startswith("sqlite"):
+        return url
 
-@pytest.fixture(scope="function")
+    base_url = make_url(url)
+    worker_db = f"{base_url.database}_{worker}"
+
+    admin = create_async_engine(base_url, isolation_level="AUTOCOMMIT")
+    async with admin.connect() as conn:
+        exists = await conn.scalar(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": worker_db}
+        )
+        if not exists:
+            await conn.execute(text(f'CREATE DATABASE "{worker_db}"'))
+    await admin.dispose()
+
+    return base_url.set(database=worker_db).render_as_string(hide_password=False)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop the fixtures share."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_engine():
-    """Create a test database engine."""
-    engine = create_async_engine(
-        TEST_DATABASE_URL,
-        echo=False,
-        future=True
-    )
+    """Create the test database engine and schema once per session."""
+    if not TEST_DATABASE_URL.startswith("sqlite"):
+        engine = create_async_engine(await _worker_database_url(TEST_DATABASE_URL), echo=False)
+    else:
+        engine = create_async_engine(
+            TEST_DATABASE_URL,
+            echo=False,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False}
+        )
+
+        # pysqlite/aiosqlite manage transactions themselves, which breaks
+        # SAVEPOINT; take over BEGIN so per-test rollback works.
+        @event.listens_for(engine.sync_engine, "connect")
+        def _disable_driver_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
-
     await engine.dispose()
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(loop_scope="session")
 async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session = sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
-    )
+    """
+    Create a test database session inside a rolled-back transaction.
+
+    Commits made by the code under test only release a SAVEPOINT; the
+    outer transaction is rolled back afterwards, so each test starts
+    from the empty schema without recreating it.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
 
-    async with async_session() as session:
         # Create default user
         user = User(id=1, username="test_user", email="test@example.com")
         session.add(user)
@@ -59,17 +111,72 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
 
         yield session
 
+        # Rolled-back tags must not survive in the list_tags cache
+        TagService.invalidate_cache()
+        await session.close()
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def common_tags(db_session) -> Dict[str, Tag]:
+    """Seed the tags most tests use, in one flush, keyed by name."""
+    tags = [
+        Tag(name="work", color="#EF4444"),
+        Tag(name="urgent", color="#F59E0B"),
+        Tag(name="personal", color="#3B82F6"),
+    ]
+    db_session.add_all(tags)
+    await db_session.flush()
+    return {tag.name: tag for tag in tags}
+
+
+@pytest.fixture
+def bulk_seed(db_session) -> Callable[[List[Dict[str, Any]]], Awaitable[List[Task]]]:
+    """
+    Provide a helper inserting tasks from column values in one flush.
 
-@pytest.fixture(scope="function")
-async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with database dependency override."""
+    Skips TaskService, for tests whose setup does not exercise it.
+    """
+
+    async def seed(specs: List[Dict[str, Any]]) -> List[Task]:
+        tasks = [Task(**spec) for spec in specs]
+        db_session.add_all(tasks)
+        await db_session.flush()
+        return tasks
+
+    return seed
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """
+    Stand-in AsyncSession whose lookups find nothing.
+
+    For not-found paths that never reach the database; scalar() returns
+    None and execute() reports no affected rows.
+    """
+    session = AsyncMock(spec=AsyncSession)
+    session.scalar.return_value = None
+    session.execute.return_value.rowcount = 0
+    return session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one HTTP client calling the app in-process for the session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(app_client, db_session) -> AsyncGenerator[AsyncClient, None]:
+    """Point the shared test client at this test's database session."""
 
     async def override_get_session():
         yield db_session
 
     app.dependency_overrides[get_session] = override_get_session
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    yield app_client
 
     app.dependency_overrides.clear()
@@ -1,8 +1,16 @@
 """Tests for task API endpoints."""
-import pytest
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.schemas.task import TaskResponse
+
+
+# Validates a whole task list payload against the response schema
+TaskListAdapter = TypeAdapter(List[TaskResponse])
 
 
-@pytest.mark.asyncio
 async def test_create_task_api(client):
     """Test POST /api/v1/tasks endpoint."""
     response = await client.post(
@@ -23,7 +31,6 @@ async def test_create_task_api(client):
     assert data["message"] == "Task created successfully"
 
 
-@pytest.mark.asyncio
 async def test_create_task_validation_error(client):
     """Test creating task with invalid data."""
     response = await client.post(
@@ -34,7 +41,6 @@ async def test_create_task_validation_error(client):
     assert response.status_code == 422
 
 
-@pytest.mark.asyncio
 async def test_list_tasks_api(client):
     """Test GET /api/v1/tasks endpoint."""
     # Create test tasks
@@ -56,7 +62,22 @@ async def test_list_tasks_api(client):
     assert len(data["data"]["tasks"]) == 2
 
 
-@pytest.mark.asyncio
+async def test_list_tasks_matches_response_schema(client):
+    """Test that the hand-built list payload still matches TaskResponse."""
+    await client.post(
+        "/api/v1/tasks",
+        json={"title": "Task 1", "tags": ["work"], "due_date": "2030-01-01T09:00:00"}
+    )
+
+    response = await client.get("/api/v1/tasks")
+
+    payload = response.json()["data"]["tasks"]
+    tasks = TaskListAdapter.validate_python(payload)
+    assert [set(item) for item in payload] == [set(TaskResponse.model_fields)]
+    # Stored naive UTC timestamps are rendered with an explicit offset
+    assert tasks[0].due_date == datetime(2030, 1, 1, 9, tzinfo=timezone.utc)
+
+
 async def test_list_tasks_filter_priority(client):
     """Test filtering tasks by priority."""
     await client.post("/api/v1/tasks", json={"title": "High", "priority": "high"})
@@ -70,7 +91,28 @@ async def test_list_tasks_filter_priority(client):
     assert data["data"]["tasks"][0]["title"] == "High"
 
 
-@pytest.mark.asyncio
+async def test_list_tasks_next_cursor(client):
+    """Test paging through tasks with next_cursor."""
+    await client.post("/api/v1/tasks", json={"title": "Task 1"})
+    await client.post("/api/v1/tasks", json={"title": "Task 2"})
+
+    response = await client.get("/api/v1/tasks?sort=title_asc&limit=1")
+    first = response.json()["data"]
+    assert first["tasks"][0]["title"] == "Task 1"
+    assert first["next_cursor"] is not None
+
+    response = await client.get(
+        "/api/v1/tasks",
+        params={"sort": "title_asc", "limit": 1, "cursor": first["next_cursor"]}
+    )
+    second = response.json()["data"]
+    assert second["tasks"][0]["title"] == "Task 2"
+    assert second["total"] is None
+
+    response = await client.get("/api/v1/tasks?cursor=not-a-cursor")
+    assert response.status_code == 422
+
+
 async def test_get_task_api(client):
     """Test GET /api/v1/tasks/{id} endpoint."""
     # Create a task
@@ -89,7 +131,6 @@ async def test_get_task_api(client):
     assert data["data"]["title"] == "Get Me"
 
 
-@pytest.mark.asyncio
 async def test_get_task_not_found(client):
     """Test getting non-existent task."""
     response = await client.get("/api/v1/tasks/999")
@@ -97,7 +138,6 @@ async def test_get_task_not_found(client):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_update_task_api(client):
     """Test PATCH /api/v1/tasks/{id} endpoint."""
     # Create a task
@@ -120,7 +160,6 @@ async def test_update_task_api(client):
     assert data["message"] == "Task updated successfully"
 
 
-@pytest.mark.asyncio
 async def test_update_task_not_found(client):
     """Test updating non-existent task."""
     response = await client.patch(
@@ -131,7 +170,6 @@ async def test_update_task_not_found(client):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_update_task_no_fields(client):
     """Test updating with no fields."""
     create_response = await client.post(
@@ -145,7 +183,23 @@ async def test_update_task_no_fields(client):
     assert response.status_code == 422
 
 
-@pytest.mark.asyncio
+async def test_update_task_falsy_field_only(client):
+    """Test that a single falsy field still counts as an update."""
+    create_response = await client.post(
+        "/api/v1/tasks",
+        json={"title": "Task", "description": "Details"}
+    )
+    task_id = create_response.json()["data"]["id"]
+
+    response = await client.patch(
+        f"/api/v1/tasks/{task_id}",
+        json={"description": ""}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["description"] == ""
+
+
 async def test_delete_task_api(client):
     """Test DELETE /api/v1/tasks/{id} endpoint."""
     # Create a task
@@ -167,7 +221,6 @@ async def test_delete_task_api(client):
     assert get_response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_delete_task_not_found(client):
     """Test deleting non-existent task."""
     response = await client.delete("/api/v1/tasks/999")
@@ -175,7 +228,6 @@ async def test_delete_task_not_found(client):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_list_tags_api(client):
     """Test GET /api/v1/tags endpoint."""
     # Create a task with tags
@@ -191,7 +243,6 @@ async def test_list_tags_api(client):
     assert len(data["data"]) == 2
 
 
-@pytest.mark.asyncio
 async def test_create_tag_api(client):
     """Test POST /api/v1/tags endpoint."""
     response = await client.post(
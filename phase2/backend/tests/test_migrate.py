@@ -0,0 +1,54 @@
+"""Tests for scripts/migrate.py adopting databases without migration history."""
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+BACKEND_DIR = Path(__file__).parent.parent
+HEAD_REVISION = "6e82e5db5d06"
+
+
+def _run(db_path: Path, *args: str) -> None:
+    """Run a Python command from the backend directory against a file SQLite database."""
+    env = {**os.environ, "DATABASE_URL": f"sqlite+aiosqlite:///{db_path}"}
+    subprocess.run([sys.executable, *args], cwd=BACKEND_DIR, env=env, check=True)
+
+
+def _schema(db_path: Path):
+    """Return the recorded revision and index names of a migrated database."""
+    with sqlite3.connect(db_path) as conn:
+        [(revision,)] = conn.execute("SELECT version_num FROM alembic_version").fetchall()
+        indexes = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    return revision, indexes
+
+
+@pytest.mark.parametrize("revision", ["45e1a6a6e4a2", "3c255d3c2ea0"])
+def test_migrate_adopts_untracked_schema(tmp_path, revision):
+    """A schema built at an older revision upgrades once its history is lost."""
+    db_path = tmp_path / "todo.db"
+    _run(db_path, "-m", "alembic", "upgrade", revision)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE alembic_version")
+
+    _run(db_path, "scripts/migrate.py")
+
+    revision, indexes = _schema(db_path)
+    assert revision == HEAD_REVISION
+    assert {"uq_tags_user_name", "ix_tasks_user_due"} <= indexes
+    assert "ix_tasks_completed" not in indexes
+
+
+def test_migrate_adopts_init_db_schema(tmp_path):
+    """A schema init_db created from the current models is stamped at head."""
+    db_path = tmp_path / "todo.db"
+    _run(db_path, "-c", "import asyncio, app.models; from app.database import init_db; asyncio.run(init_db())")
+
+    _run(db_path, "scripts/migrate.py")
+
+    revision, indexes = _schema(db_path)
+    assert revision == HEAD_REVISION
+    assert "uq_tags_user_name" in indexes
@@ -1,25 +1,22 @@
 """Tests for database models."""
-import pytest
 from datetime import datetime
 
 from app.models import User, Tag, Task, TaskTag, PriorityEnum
 
 
-@pytest.mark.asyncio
 async def test_create_user(db_session):
     """Test creating a user."""
-    user = User(username="testuser", email="test@example.com")
+    user = User(username="new_user", email="new_user@example.com")
     db_session.add(user)
     await db_session.commit()
     await db_session.refresh(user)
 
     assert user.id is not None
-    assert user.username == "testuser"
-    assert user.email == "test@example.com"
+    assert user.username == "new_user"
+    assert user.email == "new_user@example.com"
     assert isinstance(user.created_at, datetime)
 
 
-@pytest.mark.asyncio
 async def test_create_tag(db_session):
     """Test creating a tag."""
     tag = Tag(name="personal", color="#3B82F6", user_id=1)
@@ -33,7 +30,6 @@ async def test_create_tag(db_session):
     assert tag.user_id == 1
 
 
-@pytest.mark.asyncio
 async def test_create_task(db_session):
     """Test creating a task."""
     task = Task(
@@ -56,7 +52,6 @@ async def test_create_task(db_session):
     assert isinstance(task.updated_at, datetime)
 
 
-@pytest.mark.asyncio
 async def test_task_with_tags(db_session):
     """Test task with tag relationships."""
     # Create tag
@@ -80,7 +75,6 @@ async def test_task_with_tags(db_session):
     assert task.tags[0].name == "work"
 
 
-@pytest.mark.asyncio
 async def test_priority_enum():
     """Test PriorityEnum values."""
     assert PriorityEnum.HIGH.value == "high"
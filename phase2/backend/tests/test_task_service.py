@@ -1,13 +1,24 @@
 """Tests for TaskService."""
+import base64
+import json
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
+from sqlalchemy.exc import InvalidRequestError
 
-from app.services.task_service import TaskService, TagService
+from app.services import task_service
+from app.services.task_service import TaskService, TagService, _insert_tags
 from app.schemas.task import TaskCreate, TaskUpdate
 from app.models.task import PriorityEnum
 
 
-@pytest.mark.asyncio
+# Static payloads, validated once at import; the service only reads them
+_TASK = TaskCreate(title="Task")
+_FIND_ME = TaskCreate(title="Find Me")
+_TAGGED_TASK = TaskCreate(title="Tagged Task", tags=["work"])
+_WORK_HOME_TASK = TaskCreate(title="Task", tags=["work", "home"])
+
+
 async def test_create_task_basic(db_session):
     """Test creating a basic task."""
     task_data = TaskCreate(
@@ -26,7 +37,6 @@ async def test_create_task_basic(db_session):
     assert len(task.tags) == 0
 
 
-@pytest.mark.asyncio
 async def test_create_task_with_tags(db_session):
     """Test creating a task with tags."""
     task_data = TaskCreate(
@@ -41,84 +51,135 @@ async def test_create_task_with_tags(db_session):
     assert {tag.name for tag in task.tags} == {"work", "urgent"}
 
 
-@pytest.mark.asyncio
-async def test_list_tasks_all(db_session):
-    """Test listing all tasks."""
-    # Create tasks
-    await TaskService.create_task(
-        db_session,
-        TaskCreate(title="Task 1", priority=PriorityEnum.HIGH)
-    )
-    await TaskService.create_task(
+async def test_create_task_reuses_existing_tags(db_session, common_tags):
+    """Test that tag names are matched case-insensitively and deduplicated."""
+    work = common_tags["work"]
+
+    task = await TaskService.create_task(
         db_session,
-        TaskCreate(title="Task 2", priority=PriorityEnum.MEDIUM)
+        TaskCreate(title="Tagged Task", tags=["Work", "work", "home"])
     )
 
-    tasks, total = await TaskService.list_tasks(db_session)
+    assert {tag.name for tag in task.tags} == {"work", "home"}
+    assert work.id in {tag.id for tag in task.tags}
 
-    assert total == 2
-    assert len(tasks) == 2
 
+@pytest_asyncio.fixture(loop_scope="session")
+async def seeded_tasks(bulk_seed):
+    """Insert one task per priority directly, in a single flush."""
+    return await bulk_seed([
+        {"title": "High Active", "priority": PriorityEnum.HIGH.value},
+        {"title": "Medium Completed", "priority": PriorityEnum.MEDIUM.value, "completed": True},
+        {"title": "Low Active", "priority": PriorityEnum.LOW.value},
+    ])
 
-@pytest.mark.asyncio
-async def test_list_tasks_filter_status(db_session):
-    """Test filtering tasks by status."""
-    # Create tasks
-    task1 = await TaskService.create_task(
-        db_session,
-        TaskCreate(title="Active Task")
-    )
-    task2 = await TaskService.create_task(
-        db_session,
-        TaskCreate(title="Completed Task")
-    )
 
-    # Mark one as completed
-    await TaskService.update_task(
-        db_session,
-        task2.id,
-        TaskUpdate(completed=True)
-    )
+@pytest.mark.parametrize("filters,expected_titles", [
+    ({}, {"High Active", "Medium Completed", "Low Active"}),
+    ({"status": "active"}, {"High Active", "Low Active"}),
+    ({"status": "completed"}, {"Medium Completed"}),
+    ({"priority": PriorityEnum.HIGH}, {"High Active"}),
+])
+async def test_list_tasks_filters(db_session, seeded_tasks, filters, expected_titles):
+    """Test listing tasks with status and priority filters."""
+    tasks, total = await TaskService.list_tasks(db_session, **filters)
 
-    # Filter active
-    tasks, total = await TaskService.list_tasks(db_session, status="active")
-    assert total == 1
-    assert tasks[0].title == "Active Task"
+    assert total == len(expected_titles)
+    assert {task.title for task in tasks} == expected_titles
 
-    # Filter completed
-    tasks, total = await TaskService.list_tasks(db_session, status="completed")
-    assert total == 1
-    assert tasks[0].title == "Completed Task"
 
+async def test_list_tasks_sort_priority_desc(db_session, bulk_seed):
+    """Test that priority sorting ranks high, medium, then low."""
+    await bulk_seed([
+        {"title": f"{priority.value} task", "priority": priority.value}
+        for priority in [PriorityEnum.MEDIUM, PriorityEnum.LOW, PriorityEnum.HIGH]
+    ])
 
-@pytest.mark.asyncio
-async def test_list_tasks_filter_priority(db_session):
-    """Test filtering tasks by priority."""
-    await TaskService.create_task(
-        db_session,
-        TaskCreate(title="High Priority", priority=PriorityEnum.HIGH)
-    )
-    await TaskService.create_task(
-        db_session,
-        TaskCreate(title="Low Priority", priority=PriorityEnum.LOW)
-    )
+    tasks, _ = await TaskService.list_tasks(db_session, sort_by="priority_desc")
+
+    assert [task.priority for task in tasks] == ["high", "medium", "low"]
+
+
+async def test_list_tasks_paginated_total(db_session):
+    """Test that total counts all matches, not just the returned page."""
+    for _ in range(3):
+        await TaskService.create_task(db_session, _WORK_HOME_TASK)
 
     tasks, total = await TaskService.list_tasks(
         db_session,
-        priority=PriorityEnum.HIGH
+        tags=["work", "home"],
+        limit=2
     )
+    assert total == 3
+    assert len(tasks) == 2
 
-    assert total == 1
-    assert tasks[0].title == "High Priority"
+    # A page past the end still reports the total
+    tasks, total = await TaskService.list_tasks(db_session, offset=10)
+    assert total == 3
+    assert tasks == []
+
+
+@pytest.mark.parametrize("sort_by", ["created_desc", "created_asc", "title_asc"])
+async def test_list_tasks_cursor_pages(db_session, bulk_seed, sort_by):
+    """Test that following cursors walks every task exactly once, in order."""
+    # Three full pages, with repeated titles so ties span page boundaries
+    await bulk_seed([
+        {"title": title}
+        for title in ["Task C", "Task A", "Task B", "Task A", "Task C", "Task A"]
+    ])
+
+    expected, _ = await TaskService.list_tasks(db_session, sort_by=sort_by)
+
+    pages = []
+    cursor = None
+    while True:
+        tasks, total = await TaskService.list_tasks(
+            db_session, sort_by=sort_by, limit=2, cursor=cursor
+        )
+        # Only the first page counts the matches
+        assert total == (6 if cursor is None else None)
+        pages.append([task.id for task in tasks])
+        if not tasks:
+            break
+        cursor = TaskService.encode_cursor(tasks[-1], sort_by)
+
+    # Later cursors come from cursor pages; the one after the last task finds nothing
+    assert [len(page) for page in pages] == [2, 2, 2, 0]
+    seen = [task_id for page in pages for task_id in page]
+    assert len(set(seen)) == len(seen)
+    assert seen == [task.id for task in expected]
+
+
+async def test_list_tasks_cursor_rejects_other_sort(db_session):
+    """Test that a cursor is only accepted for the sort it was made for."""
+    task = await TaskService.create_task(db_session, _TASK)
+    cursor = TaskService.encode_cursor(task, "title_asc")
+
+    with pytest.raises(ValueError):
+        await TaskService.list_tasks(db_session, sort_by="created_desc", cursor=cursor)
+    with pytest.raises(ValueError):
+        await TaskService.list_tasks(db_session, sort_by="due_asc", cursor=cursor)
+
+
+@pytest.mark.parametrize("sort_by,payload", [
+    ("title_asc", ["title_asc", ["x"], 1]),
+    ("title_asc", ["title_asc", "x", "1"]),
+    ("title_asc", ["title_asc", "x", True]),
+    ("created_desc", ["created_desc", 123, 1]),
+    ("created_desc", ["created_desc", "not-a-date", 1]),
+    ("title_asc", {"s": "title_asc", "v": "x", "id": 1}),
+])
+async def test_list_tasks_cursor_rejects_malformed_values(db_session, sort_by, payload):
+    """Test that crafted cursors fail validation instead of reaching the driver."""
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    with pytest.raises(ValueError):
+        await TaskService.list_tasks(db_session, sort_by=sort_by, cursor=cursor)
 
 
-@pytest.mark.asyncio
 async def test_get_task_by_id(db_session):
     """Test getting a task by ID."""
-    created_task = await TaskService.create_task(
-        db_session,
-        TaskCreate(title="Find Me")
-    )
+    created_task = await TaskService.create_task(db_session, _FIND_ME)
 
     task = await TaskService.get_task_by_id(db_session, created_task.id)
 
@@ -127,14 +188,27 @@ async def test_get_task_by_id(db_session):
     assert task.title == "Find Me"
 
 
-@pytest.mark.asyncio
-async def test_get_task_not_found(db_session):
+async def test_get_task_by_id_without_tags(db_session):
+    """Test that include_tags=False loads the row but refuses lazy tag loads."""
+    created_task = await TaskService.create_task(db_session, _TAGGED_TASK)
+    db_session.expunge_all()
+
+    task = await TaskService.get_task_by_id(
+        db_session, created_task.id, include_tags=False
+    )
+
+    assert task.title == "Tagged Task"
+    # raiseload: touching the unloaded collection must raise, not query
+    with pytest.raises(InvalidRequestError):
+        _ = task.tags
+
+
+async def test_get_task_not_found(mock_session):
     """Test getting a non-existent task."""
-    task = await TaskService.get_task_by_id(db_session, 999)
+    task = await TaskService.get_task_by_id(mock_session, 999)
     assert task is None
 
 
-@pytest.mark.asyncio
 async def test_update_task(db_session):
     """Test updating a task."""
     task = await TaskService.create_task(
@@ -154,7 +228,63 @@ async def test_update_task(db_session):
     assert updated_task.completed is True
 
 
-@pytest.mark.asyncio
+async def test_update_task_bumps_updated_at(db_session):
+    """Test that any update, even tag-only, sets a newer updated_at."""
+    task = await TaskService.create_task(db_session, _TASK)
+    old_timestamp = datetime(2000, 1, 1)
+    task.updated_at = old_timestamp
+    await db_session.commit()
+
+    updated_task = await TaskService.update_task(
+        db_session,
+        task.id,
+        TaskUpdate(tags=["work"])
+    )
+
+    assert isinstance(updated_task.updated_at, datetime)
+    assert updated_task.updated_at > old_timestamp
+
+
+async def test_update_task_never_precedes_created_at(db_session):
+    """Test that an immediate update keeps updated_at >= created_at."""
+    task = await TaskService.create_task(db_session, _TASK)
+
+    updated_task = await TaskService.update_task(db_session, task.id, TaskUpdate(completed=True))
+
+    assert updated_task.updated_at >= updated_task.created_at
+
+
+async def test_update_task_replaces_tags(db_session):
+    """Test that updating tags replaces the task's tag set."""
+    task = await TaskService.create_task(db_session, _TAGGED_TASK)
+
+    updated_task = await TaskService.update_task(
+        db_session,
+        task.id,
+        TaskUpdate(tags=["home", "urgent"])
+    )
+
+    assert {tag.name for tag in updated_task.tags} == {"home", "urgent"}
+
+
+async def test_update_task_keeps_unchanged_tags(db_session):
+    """Test that tags kept across an update keep their association."""
+    task = await TaskService.create_task(
+        db_session,
+        TaskCreate(title="Tagged Task", tags=["work", "urgent"])
+    )
+    kept_id = next(tag.id for tag in task.tags if tag.name == "work")
+
+    updated_task = await TaskService.update_task(
+        db_session,
+        task.id,
+        TaskUpdate(tags=["Work", "home"])
+    )
+
+    assert {tag.name for tag in updated_task.tags} == {"work", "home"}
+    assert kept_id in {tag.id for tag in updated_task.tags}
+
+
 async def test_delete_task(db_session):
     """Test deleting a task."""
     task = await TaskService.create_task(
@@ -170,14 +300,13 @@ async def test_delete_task(db_session):
     assert deleted_task is None
 
 
-@pytest.mark.asyncio
-async def test_delete_task_not_found(db_session):
+async def test_delete_task_not_found(mock_session):
     """Test deleting a non-existent task."""
-    result = await TaskService.delete_task(db_session, 999)
+    result = await TaskService.delete_task(mock_session, 999)
     assert result is False
+    mock_session.delete.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_create_tag(db_session):
     """Test creating a tag."""
     tag = await TagService.create_tag(db_session, "personal", "#3B82F6")
@@ -187,13 +316,54 @@ async def test_create_tag(db_session):
     assert tag.color == "#3B82F6"
 
 
-@pytest.mark.asyncio
-async def test_list_tags(db_session):
+async def test_insert_tags_skips_existing(db_session, common_tags):
+    """Test that inserting an existing tag name returns the stored tag."""
+    personal = common_tags["personal"]
+
+    tags = await _insert_tags(db_session, {"personal", "home"}, user_id=1)
+
+    assert {tag.name for tag in tags} == {"personal", "home"}
+    assert personal.id in {tag.id for tag in tags}
+
+
+async def test_insert_tags_without_upsert_support(db_session, monkeypatch):
+    """Test that dialects without ON CONFLICT fall back to a plain insert."""
+    monkeypatch.setattr(task_service, "_UPSERT_INSERTS", {})
+
+    tags = await _insert_tags(db_session, {"work", "home"}, user_id=1)
+
+    assert {tag.name for tag in tags} == {"work", "home"}
+    assert all(tag.id is not None for tag in tags)
+
+
+async def test_list_tags(db_session, common_tags):
     """Test listing tags."""
+    tags = await TagService.list_tags(db_session)
+
+    assert len(tags) == 3
+    assert {tag.name for tag in tags} == {"work", "urgent", "personal"}
+
+
+async def test_list_tags_cache_invalidated_by_new_tags(db_session):
+    """Test that cached tag lists pick up tags created afterwards."""
     await TagService.create_tag(db_session, "work", "#EF4444")
+    assert [tag.name for tag in await TagService.list_tags(db_session)] == ["work"]
+
     await TagService.create_tag(db_session, "personal", "#3B82F6")
+    await TaskService.create_task(
+        db_session,
+        TaskCreate(title="Tagged Task", tags=["urgent"])
+    )
 
     tags = await TagService.list_tags(db_session)
+    assert [tag.name for tag in tags] == ["personal", "urgent", "work"]
+
+
+async def test_list_tags_cache_evicts_least_recently_used(db_session, monkeypatch):
+    """Test that the tag cache keeps only the most recently listed users."""
+    monkeypatch.setattr(task_service, "TAG_CACHE_MAXSIZE", 2)
+
+    for user_id in (1, 2, 1, 3):
+        await TagService.list_tags(db_session, user_id)
 
-    assert len(tags) == 2
-    assert {tag.name for tag in tags} == {"work", "personal"}
+    assert list(task_service._tag_cache) == [1, 3]